@@ -1,12 +1,203 @@
+import os
 import sys
+import mmap
+import hashlib
+from array import array
+from math import gcd
 
-def solve():
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from xtreme19 import profiling
+from xtreme19.fastio import TokenReader, Writer
+
+# Budgets whose bitset would exceed this many bits (16 MiB) use the
+# residue engine instead
+BITSET_MAX_BITS = 1 << 27
+
+# If set, bitsets are persisted in this directory and memory-mapped
+# by later runs with the same fare set
+CACHE_DIR = os.environ.get("AIRLINE_BITSET_CACHE")
+
+class RoundTripBitset:
+    """
+    Unbounded knapsack over round trips, done with big-integer shifts.
+    Every round trip costs 2 * cost, so bit x of the bitset is set iff
+    a round-trip total of 2 * x is possible within budget k.
+    """
+    def __init__(self, bits):
+        # Little-endian bytes (or a read-only mmap) give O(1) lookups
+        self.bits = bits
+
+    @classmethod
+    def build(cls, distinct_costs, k):
+        """Runs the knapsack for every total up to at least k."""
+        # Round up so every bit of the last byte is valid
+        limit = k // 2 | 7
+        mask = (1 << (limit + 1)) - 1
+        # Base case: cost 0 is possible (no flights)
+        reachable = 1
+
+        for cost in sorted(distinct_costs):
+            # Only consider valid, useful costs
+            if cost <= 0 or cost > limit:
+                continue
+            # Already a sum of cheaper round trips (e.g. a multiple of one),
+            # so it cannot add anything new
+            if reachable >> cost & 1:
+                continue
+            if profiling.ENABLED:
+                # One shift-or over limit + 1 cells per doubling step
+                profiling.count("knapsack_cell_updates", (limit + 1) * (limit // cost).bit_length())
+            # Shift-or doubling: after shifting by cost, 2*cost, 4*cost, ...
+            # every multiple of cost up to the limit has been added
+            shift = cost
+            while shift <= limit:
+                reachable |= (reachable << shift) & mask
+                shift <<= 1
+
+        return cls(reachable.to_bytes((limit + 1) // 8, 'little'))
+
+    @classmethod
+    def load_or_build(cls, distinct_costs, k, cache_dir):
+        """
+        Memory-maps a cached bitset for this fare set if one covering k
+        exists in cache_dir; otherwise builds it and saves it there.
+        """
+        fares = sorted(cost for cost in set(distinct_costs) if cost > 0)
+        key = hashlib.sha256(",".join(map(str, fares)).encode()).hexdigest()[:32]
+        path = os.path.join(cache_dir, key + ".bits")
+        try:
+            with open(path, 'rb') as cache_file:
+                if os.fstat(cache_file.fileno()).st_size * 8 > k // 2:
+                    return cls(mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ))
+        except FileNotFoundError:
+            pass
+
+        table = cls.build(fares, k)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write then rename, so readers never see a partial file
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as cache_file:
+            cache_file.write(table.bits)
+        os.replace(temp_path, path)
+        return table
+
+    def is_reachable(self, x):
+        """True if x is a sum of round trips (x must not exceed the built k)."""
+        if x < 0 or x & 1:
+            return False
+        half = x >> 1
+        return bool(self.bits[half >> 3] >> (half & 7) & 1)
+
+    def reachable_many(self, xs):
+        """Vectorized is_reachable over a NumPy int64 array of totals."""
+        bits = np.frombuffer(self.bits, dtype=np.uint8)
+        valid = (xs >= 0) & ((xs & 1) == 0)
+        half = np.where(valid, xs >> 1, 0)
+        return valid & ((bits[half >> 3] >> (half & 7)) & 1).astype(bool)
+
+class RoundTripResidues:
+    """
+    Round-trip reachability for arbitrarily large budgets.
+    Works in half-costs like RoundTripBitset. For every residue r modulo
+    the cheapest fare m, min_total[r] is the smallest reachable half-sum
+    congruent to r; any larger half-sum in that class is reachable by
+    adding more cheapest round trips. Memory is O(m), independent of k.
+    """
+    def __init__(self, distinct_costs):
+        costs = sorted(cost for cost in distinct_costs if cost > 0)
+        self.modulus = modulus = costs[0] if costs else 0
+        unreachable = -1
+        min_total = array('q', [unreachable]) * max(modulus, 1)
+        min_total[0] = 0
+
+        # Round-robin shortest paths on the residue graph: adding fare c
+        # moves residue r to (r + c) % m, so each fare splits the residues
+        # into gcd(m, c) cycles that are relaxed in one walk each.
+        for cost in costs[1:]:
+            step = cost % modulus
+            best = min_total[step]
+            # Already reachable from cheaper fares, nothing new to add
+            if best != unreachable and best <= cost:
+                continue
+            cycles = gcd(modulus, step)
+            cycle_length = modulus // cycles
+            for first in range(cycles):
+                # Start the walk at the cycle's smallest known total
+                start = unreachable
+                total = unreachable
+                residue = first
+                for _ in range(cycle_length):
+                    value = min_total[residue]
+                    if value != unreachable and (total == unreachable or value < total):
+                        start, total = residue, value
+                    residue = (residue + step) % modulus
+                if start == unreachable:
+                    continue
+                residue = start
+                for _ in range(cycle_length - 1):
+                    total += cost
+                    residue = (residue + step) % modulus
+                    value = min_total[residue]
+                    if value == unreachable or total < value:
+                        min_total[residue] = total
+                    else:
+                        total = value
+            if profiling.ENABLED:
+                profiling.count("knapsack_cell_updates", modulus - cycles)
+
+        self.min_total = min_total
+
+    def is_reachable(self, x):
+        """True if x is a sum of round trips."""
+        if x < 0 or x & 1:
+            return False
+        half = x >> 1
+        if not self.modulus:
+            return half == 0
+        best = self.min_total[half % self.modulus]
+        return best != -1 and best <= half
+
+    def reachable_many(self, xs):
+        """Vectorized is_reachable over a NumPy int64 array of totals."""
+        valid = (xs >= 0) & ((xs & 1) == 0)
+        half = np.where(valid, xs >> 1, 0)
+        if not self.modulus:
+            return valid & (half == 0)
+        best = np.frombuffer(self.min_total, dtype=np.int64)[half % self.modulus]
+        return valid & (best != -1) & (best <= half)
+
+def format_answers(is_possible):
+    """
+    Encodes a NumPy bool array as "Yes"/"No" lines in one bytes block.
+    Each answer is a 4-byte row ("Yes\n" or "No\n" plus padding);
+    dropping the padding leaves the finished output.
+    """
+    rows = np.frombuffer(b"No\n\0Yes\n", dtype=np.uint8).reshape(2, 4)
+    answer_bytes = rows[is_possible.astype(np.intp)].ravel()
+    return answer_bytes[answer_bytes != 0].tobytes()
+
+@profiling.timed("knapsack")
+def build_round_trips(distinct_costs, k, residues=False):
+    """
+    Picks the reachability engine for budget k. Huge budgets (or
+    residues=True, from --residues) use the residue engine, whose memory
+    depends on the cheapest fare instead of k.
+    """
+    if residues or k // 2 > BITSET_MAX_BITS:
+        return RoundTripResidues(distinct_costs)
+    if CACHE_DIR:
+        return RoundTripBitset.load_or_build(distinct_costs, k, CACHE_DIR)
+    return RoundTripBitset.build(distinct_costs, k)
+
+def solve(reader, writer, residues=False):
     """
     Uses dynamic programming to solve the Airline Traveling problem.
     """
-    # Use fast I/O
-    input = sys.stdin.readline
-    output = sys.stdout.write
+    input = reader.readline
 
     try:
         n_str, k_str = input().split()
@@ -25,21 +216,9 @@ def solve():
 
     # --- DP Preprocessing ---
     
-    # reachable_round_trip_cost[x] is true if cost x is possible
+    # round_trips answers whether cost x <= k is possible
     # using only round trips (0 -> i -> 0)
-    reachable_round_trip_cost = [False] * (k + 1)
-    # Base case: cost 0 is possible (no flights)
-    reachable_round_trip_cost[0] = True
-    
-    # Unbounded knapsack-style DP
-    for cost in distinct_costs:
-        round_trip_cost = 2 * cost
-        
-        # Only consider valid, useful costs
-        if round_trip_cost > 0 and round_trip_cost <= k:
-            for x in range(round_trip_cost, k + 1):
-                if reachable_round_trip_cost[x - round_trip_cost]:
-                    reachable_round_trip_cost[x] = True
+    round_trips = build_round_trips(distinct_costs, k, residues)
 
     # --- Answer Queries ---
     try:
@@ -56,19 +235,19 @@ def solve():
         
         if a == 0 and b == 0:
             # Case 1: 0 -> 0. Must be a sum of round trips.
-            is_possible = reachable_round_trip_cost[k]
+            is_possible = round_trips.is_reachable(k)
             
         elif a == 0 and b != 0:
             # Case 2: 0 -> b. Path: (Round trips) + (0 -> b)
             cost_b = city_costs[b]
             if k >= cost_b:
-                is_possible = reachable_round_trip_cost[k - cost_b]
+                is_possible = round_trips.is_reachable(k - cost_b)
                 
         elif a != 0 and b == 0:
             # Case 3: a -> 0. Path: (a -> 0) + (Round trips)
             cost_a = city_costs[a]
             if k >= cost_a:
-                is_possible = reachable_round_trip_cost[k - cost_a]
+                is_possible = round_trips.is_reachable(k - cost_a)
                 
         else:
             # Case 4: a -> b. Path: (a -> 0) + (Round trips) + (0 -> b)
@@ -76,11 +255,99 @@ def solve():
             cost_b = city_costs[b]
             required_legs_cost = cost_a + cost_b
             if k >= required_legs_cost:
-                is_possible = reachable_round_trip_cost[k - required_legs_cost]
+                is_possible = round_trips.is_reachable(k - required_legs_cost)
 
         query_answers.append("Yes" if is_possible else "No")
 
-    output("\n".join(query_answers) + "\n")
+    writer.write("\n".join(query_answers) + "\n")
+    profiling.count("queries", q)
+
+def solve_batch(reader, writer, residues=False):
+    """
+    Same as solve(), but parses the whole input into NumPy arrays and
+    answers every query with array operations and one write.
+    """
+    with profiling.phase("parse"):
+        values = reader.ints_array()
+    if len(values) < 2:
+        return
+    n, k = int(values[0]), int(values[1])
+
+    # With city 0 mapped to cost 0, every query (a, b) needs exactly
+    # city_costs[a] + city_costs[b] in legs, covering all four cases
+    city_costs = np.zeros(n, dtype=np.int64)
+    city_costs[1:] = values[2:n + 1]
+
+    # --- DP Preprocessing ---
+    round_trips = build_round_trips(set(city_costs[1:].tolist()), k, residues)
+
+    # --- Answer Queries ---
+    if len(values) <= n + 1:
+        return
+    q = int(values[n + 1])
+    with profiling.phase("queries"):
+        pairs = values[n + 2:n + 2 + 2 * q].reshape(-1, 2)
+        required_legs_cost = city_costs[pairs[:, 0]] + city_costs[pairs[:, 1]]
+        is_possible = round_trips.reachable_many(k - required_legs_cost)
+        writer.write(format_answers(is_possible))
+    profiling.count("queries", len(pairs))
+
+def solve_budgets(reader, writer, residues=False):
+    """
+    Multi-budget variant: the first line holds only n, and every query
+    line is "a b k" with its own budget. Reachability is built once,
+    up to the largest requested budget.
+    """
+    with profiling.phase("parse"):
+        if np is not None:
+            values = reader.ints_array()
+        else:
+            values = reader.ints()
+    if not len(values):
+        return
+    n = int(values[0])
+    if len(values) <= n:
+        return
+
+    city_costs = [0] * n
+    city_costs[1:] = [int(cost) for cost in values[1:n]]
+    q = int(values[n])
+    triples = values[n + 1:n + 1 + 3 * q]
+    budgets = triples[2::3]
+    # NumPy arrays reduce in C; array('q') has no max() of its own
+    max_budget = (budgets.max() if np is not None else max(budgets)) if len(budgets) else 0
+
+    # --- DP Preprocessing ---
+    round_trips = build_round_trips(set(city_costs[1:]), int(max_budget), residues)
+
+    # --- Answer Queries ---
+    profiling.count("queries", len(triples) // 3)
+    if np is not None:
+        triples = triples.reshape(-1, 3)
+        costs = np.array(city_costs, dtype=np.int64)
+        remaining = triples[:, 2] - costs[triples[:, 0]] - costs[triples[:, 1]]
+        writer.write(format_answers(round_trips.reachable_many(remaining)))
+        return
+
+    query_answers = []
+    for i in range(0, len(triples) - 2, 3):
+        a, b, k = triples[i], triples[i + 1], triples[i + 2]
+        remaining = k - city_costs[a] - city_costs[b]
+        query_answers.append("Yes" if round_trips.is_reachable(remaining) else "No")
+    writer.write("\n".join(query_answers) + "\n")
+
+def run(reader, writer, argv=()):
+    """Answers the input in reader into writer; argv holds the mode flags."""
+    residues = "--residues" in argv
+    with profiling.phase("solve"):
+        if "--budgets" in argv:
+            solve_budgets(reader, writer, residues)
+        elif np is not None:
+            solve_batch(reader, writer, residues)
+        else:
+            solve(reader, writer, residues)
 
 if __name__ == "__main__":
-    solve()
\ No newline at end of file
+    writer = Writer()
+    run(TokenReader(), writer, sys.argv[1:])
+    writer.flush()
\ No newline at end of file
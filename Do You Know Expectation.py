@@ -1,57 +1,220 @@
 import sys
 
-# Use sys.stdin.readline for faster I/O
-input = sys.stdin.readline
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def add_to_xor_basis(xor_basis, value):
-    """
-    Inserts a value into a fully reduced (bidirectional) XOR basis.
-    """
-    for b in xor_basis:
-        value = min(value, value ^ b)
-    if not value:
-        return
-    for i in range(len(xor_basis)):
-        xor_basis[i] = min(xor_basis[i], xor_basis[i] ^ value)
-    xor_basis.append(value)
-    xor_basis.sort(reverse=True) # Keep basis sorted
+from xtreme19 import profiling
+from xtreme19.fastio import TokenReader, Writer
 
-def solve():
+class XorBasis:
     """
-    Main function to read input, compute expectation, and print.
+    GF(2) basis with one slot per highest set bit: slots[b] is either 0
+    or the basis vector whose top bit is b.
     """
-    line = input().split()
-    if not line:
+    def __init__(self, bit_width):
+        self.bit_width = bit_width
+        self.slots = [0] * bit_width
+        self.dim = 0
+
+    def is_full(self):
+        """True once the basis spans every bit_width-bit value."""
+        return self.dim == self.bit_width
+
+    def insert(self, value):
+        """Inserts one value. Returns True if it extended the basis."""
+        slots = self.slots
+        while value:
+            top = value.bit_length() - 1
+            if not slots[top]:
+                slots[top] = value
+                self.dim += 1
+                return True
+            value ^= slots[top]
         return False
-        
-    N, K = int(line[0]), int(line[1])
-    
-    values = list(map(int, input().split()))
-    
-    xor_basis = []
-    for val in values:
-        add_to_xor_basis(xor_basis, val)
 
-    dim = len(xor_basis)
-    if dim == 0:
-        # Only reachable value is 0. 0^K is 0 (except 0^0=1)
-        if K == 0:
-            print("1.00")
-        else:
-            print("0.00")
-        return True
+    def insert_many(self, values):
+        """Inserts values one by one, stopping early once full."""
+        for value in values:
+            if self.insert(value) and self.is_full():
+                break
+
+    def insert_array(self, values, chunk_size=1 << 16):
+        """
+        Bulk insertion of a NumPy uint64 array by Gaussian elimination
+        on whole chunks: for each bit from the top down, every value
+        with that bit set is XORed with the bit's basis vector (the
+        first such value becomes that vector if the slot is empty).
+        """
+        one = np.uint64(1)
+        for start in range(0, len(values), chunk_size):
+            if self.is_full():
+                break
+            chunk = values[start:start + chunk_size].copy()
+            for bit in range(self.bit_width - 1, -1, -1):
+                has_bit = (chunk >> np.uint64(bit)) & one
+                if not self.slots[bit]:
+                    first = int(has_bit.argmax())
+                    if not has_bit[first]:
+                        continue
+                    self.slots[bit] = int(chunk[first])
+                    self.dim += 1
+                # Branch-free: XOR the slot into exactly the values with the bit
+                chunk ^= has_bit * np.uint64(self.slots[bit])
 
-    # Generate all 2^dim reachable XOR sums
+    def reduced(self):
+        """
+        Returns the basis fully reduced (each top bit appears in exactly
+        one vector), sorted in decreasing order.
+        """
+        slots = list(self.slots)
+        for bit in range(self.bit_width):
+            if slots[bit]:
+                for higher in range(bit + 1, self.bit_width):
+                    if slots[higher] >> bit & 1:
+                        slots[higher] ^= slots[bit]
+        return sorted((b for b in slots if b), reverse=True)
+
+def enumerate_power_sums(xor_basis, exponents):
+    """
+    Sums v^K over the span for every K in exponents (ascending) by
+    generating all 2^dim reachable XOR sums.
+    """
     all_xor_sums = [0]
     for b in xor_basis:
         # Add (r ^ b) for every r already in the list
         all_xor_sums.extend([r ^ b for r in all_xor_sums])
 
-    # Sum v^K using Python's arbitrary-precision integers
-    total_pow_sum = 0
+    # Sum v^K using Python's arbitrary-precision integers. Each power
+    # is built from the previous one, multiplying only by the gap.
+    gaps = [exponents[0]] + [b - a for a, b in zip(exponents, exponents[1:])]
+    total_pow_sums = [0] * len(exponents)
     for v in all_xor_sums:
-        total_pow_sum += pow(v, K)
-        
+        power = 1
+        for index, gap in enumerate(gaps):
+            if gap == 1:
+                power *= v
+            elif gap:
+                power *= pow(v, gap)
+            total_pow_sums[index] += power
+    return total_pow_sums
+
+def expand_power_sums(xor_basis, max_K):
+    """
+    Sums v^K over the span for every K in 0..max_K without enumerating it.
+
+    Write v = sum(2^j * x_j) where bit x_j is a GF(2) linear form in the
+    basis choices. Expanding v^K, a set S of bits contributes
+    W(S) = K! [t^K] prod_{j in S} (e^(2^j t) - 1), and the x_j for j in S
+    are all 1 for exactly 2^(dim - rank(S)) choices when that system is
+    consistent (none otherwise). The sets with |S| <= max_K are walked
+    depth-first, extending W for all K at once and the elimination one
+    bit at a time, and inconsistent sets are pruned together with all
+    their supersets.
+    """
+    K = max_K
+    dim = len(xor_basis)
+
+    # forms[j] has bit i set when basis vector i has bit j set
+    bit_forms = []
+    for j in range(max(xor_basis).bit_length()):
+        form = 0
+        for i, b in enumerate(xor_basis):
+            if b >> j & 1:
+                form |= 1 << i
+        if form:
+            bit_forms.append((j, form))
+
+    binomials = [[1]]
+    for m in range(1, K + 1):
+        previous = binomials[-1]
+        binomials.append([1] + [previous[r - 1] + previous[r] for r in range(1, m)] + [1])
+
+    total_pow_sums = [0] * (K + 1)
+    # Each stack entry: (next bit index, |S|, egf, elimination rows)
+    # egf[m] = m! [t^m] of the product so far; rows hold (pivot, form, rhs)
+    # and their count is rank(S)
+    stack = [(0, 0, [1] + [0] * K, ())]
+    while stack:
+        start, size, egf, rows = stack.pop()
+        free_dims = dim - len(rows)
+        for m in range(size, K + 1):
+            total_pow_sums[m] += egf[m] << free_dims
+        if size == K:
+            # W(S) vanishes once |S| > K
+            continue
+        for index in range(start, len(bit_forms)):
+            j, form = bit_forms[index]
+            # Reduce "x_j = 1" against the current system
+            rhs = 1
+            for pivot, row_form, row_rhs in rows:
+                if form >> pivot & 1:
+                    form ^= row_form
+                    rhs ^= row_rhs
+            if form:
+                pivot = (form & -form).bit_length() - 1
+                new_rows = rows + ((pivot, form, rhs),)
+            elif rhs:
+                # Contradiction: no choice makes every x_j equal to 1
+                continue
+            else:
+                # Implied by the bits already in S
+                new_rows = rows
+
+            new_egf = [0] * (K + 1)
+            for m in range(size + 1, K + 1):
+                binomial_row = binomials[m]
+                value = 0
+                for r in range(1, m - size + 1):
+                    value += (binomial_row[r] * egf[m - r]) << (j * r)
+                new_egf[m] = value
+            stack.append((index + 1, size + 1, new_egf, new_rows))
+
+    return total_pow_sums
+
+@profiling.timed("power_sums")
+def power_sums_over_span(xor_basis, exponents):
+    """
+    Returns the sums of v^K over all 2^dim values in the span of
+    xor_basis, one per K in exponents, using whichever of enumeration
+    and bit expansion is estimated cheaper. Both share one pass over
+    the span (or over the bit sets) for all exponents.
+    """
+    wanted = sorted(set(exponents))
+    max_K = wanted[-1]
+    dim = len(xor_basis)
+    num_bits = max(xor_basis, default=0).bit_length()
+    # Expansion visits at most sum(C(num_bits, s) for s <= max_K) bit
+    # sets, each costing O(max_K^2) big-integer operations
+    expansion_cost = 0
+    subsets = 1
+    for size in range(min(max_K, num_bits) + 1):
+        expansion_cost += subsets
+        subsets = subsets * (num_bits - size) // (size + 1)
+    expansion_cost *= (max_K + 1) ** 2
+    enumeration_cost = (1 << dim) * (len(wanted) + max(1, max_K.bit_length()))
+
+    if not dim or enumeration_cost <= expansion_cost:
+        profiling.count("span_values_enumerated", 1 << dim)
+        sums = dict(zip(wanted, enumerate_power_sums(xor_basis, wanted)))
+    else:
+        profiling.count("span_values_expanded", 1 << dim)
+        all_sums = expand_power_sums(xor_basis, max_K)
+        sums = {K: all_sums[K] for K in wanted}
+    return [sums[K] for K in exponents]
+
+def sum_of_powers_over_span(xor_basis, K):
+    """
+    Returns the sum of v^K over all 2^dim values in the span of xor_basis.
+    """
+    return power_sums_over_span(xor_basis, [K])[0]
+
+def format_expectation(total_pow_sum, dim):
+    """
+    Formats total_pow_sum / 2^dim rounded to two decimals (ties up),
+    using exact fixed-point arithmetic.
+    """
     # Denominator is 2^dim
     denominator = 1 << dim
     
@@ -73,12 +236,77 @@ def solve():
     int_part = q // 100
     frac_part = q % 100
     
-    # Print in the format "INT.FRAC" with leading zero for fraction
+    # Format as "INT.FRAC" with leading zero for fraction
     # The f-string ":02d" handles the leading zero (e.g., 5 -> "05")
-    print(f"{int_part}.{frac_part:02d}")
+    return f"{int_part}.{frac_part:02d}"
+
+@profiling.timed("basis")
+def read_basis(values_line):
+    """Builds the reduced XOR basis of the values on one input line."""
+    if np is not None:
+        values = np.fromstring(values_line, dtype=np.uint64, sep=' ')
+        basis = XorBasis(int(values.max()).bit_length() if len(values) else 0)
+        basis.insert_array(values)
+    else:
+        values = list(map(int, values_line.split()))
+        basis = XorBasis(max(values, default=0).bit_length())
+        basis.insert_many(values)
+    profiling.count("values", len(values))
+    return basis.reduced()
+
+def solve(reader, writer):
+    """
+    Main function to read input, compute expectation, and print.
+    """
+    line = reader.readline().split()
+    if not line:
+        return False
+        
+    N, K = int(line[0]), int(line[1])
+    
+    xor_basis = read_basis(reader.readline())
+
+    dim = len(xor_basis)
+    if dim == 0:
+        # Only reachable value is 0. 0^K is 0 (except 0^0=1)
+        if K == 0:
+            writer.write("1.00\n")
+        else:
+            writer.write("0.00\n")
+        return True
+
+    total_pow_sum = sum_of_powers_over_span(xor_basis, K)
+    writer.write(format_expectation(total_pow_sum, dim) + "\n")
     
     return True
 
+def solve_moments(reader, writer):
+    """
+    Multi-moment variant: each case is "N Q", the N values, then a line
+    of Q exponents. Prints E[X^K] for each exponent, one per line,
+    from a single basis and a single pass over the span.
+    """
+    line = reader.readline().split()
+    if not line:
+        return False
+
+    xor_basis = read_basis(reader.readline())
+    exponents = list(map(int, reader.readline().split()))
+    if not exponents:
+        return True
+
+    dim = len(xor_basis)
+    totals = power_sums_over_span(xor_basis, exponents)
+    writer.write_lines([format_expectation(total, dim) for total in totals])
+    return True
+
+def run(reader, writer, argv=()):
+    """Answers every case in reader into writer; argv holds the mode flags."""
+    run_case = solve_moments if "--moments" in argv else solve
+    while run_case(reader, writer):
+        profiling.count("cases")
+
 if __name__ == "__main__":
-    while solve():
-        pass
\ No newline at end of file
+    writer = Writer()
+    run(TokenReader(), writer, sys.argv[1:])
+    writer.flush()
\ No newline at end of file
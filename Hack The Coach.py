@@ -3,9 +3,25 @@
 the goal is to find a test case for which the given program fails
 This prints the required static output 
 """
-print("6 1")
-print("1 2")
-print("1 3")
-print("1 4")
-print("4 5")
-print("4 6")    
\ No newline at end of file
+import sys
+
+from xtreme19.fastio import TokenReader, Writer
+
+# The failing test case: a tree on 6 nodes, one edge per line
+HACK_CASE = """6 1
+1 2
+1 3
+1 4
+4 5
+4 6
+"""
+
+def run(reader, writer, argv=()):
+    """Writes the static test case; the input is not used."""
+    writer.write(HACK_CASE)
+
+if __name__ == "__main__":
+    writer = Writer()
+    # No input is read, so do not wait on stdin
+    run(TokenReader(b""), writer, sys.argv[1:])
+    writer.flush()
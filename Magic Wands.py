@@ -1,24 +1,37 @@
+import re
 import sys
 
-# Use fast I/O
-input = sys.stdin.readline
-output = sys.stdout.write
+from xtreme19 import profiling
+from xtreme19.fastio import TokenReader, Writer
+
+# "N K S" on one line; S is taken as a zero-copy slice of the line
+CASE_PATTERN = re.compile(rb'\s*(\d+)\s+(\d+)\s+(\S+)')
+
+SAD = ord('S')
 
 def calculate_min_flips(N, K, S):
     """
     Solves a single test case for the Magic Wands problem.
+    S may be a str or any bytes-like object (bytes, memoryview).
     """
-    
+    if isinstance(S, str):
+        S = S.encode()
+    return str(count_min_flips(N, K, S))
+
+def count_min_flips(N, K, S):
+    """
+    Byte-level engine behind calculate_min_flips: S is bytes-like,
+    and the result is the flip count or -1 if impossible.
+    """
+    if K <= 0:
+        return 0 if SAD not in S[:N] else -1
+
     # 1. Initialize state
-    # is_sad[i] = 1 if 'S', 0 if 'H'
-    is_sad = [0] * N
-    for i in range(N):
-        if S[i] == 'S':
-            is_sad[i] = 1
-            
-    # flip_events[i] = 1 if a flip operation *ends* just before i
-    flip_events = [0] * (N + 1)
-    
+    # flip_events is a ring of size K: slot i % K holds whether a flip
+    # *ends* just before i, which is all we need to look K ahead
+    flip_events = bytearray(K)
+    slot = 0
+
     total_operations = 0
     active_flips = 0 # How many active flips cover the current index
 
@@ -26,13 +39,12 @@ def calculate_min_flips(N, K, S):
     # This loop is correct even if N < K (range is empty)
     for i in range(N - K + 1):
         
-        # Update active_flips: add effect of flips starting/ending at i
-        # (In this model, we only track end events)
-        active_flips ^= flip_events[i]
+        # Update active_flips: consume the end event for index i
+        active_flips ^= flip_events[slot]
         
         # Get the actual current state
         # 0 (H) or 1 (S)
-        current_state = is_sad[i] ^ active_flips
+        current_state = (S[i] == SAD) ^ active_flips
         
         if current_state == 1:
             # This student is 'S', so we MUST flip
@@ -41,10 +53,14 @@ def calculate_min_flips(N, K, S):
             # This new flip starts at i
             active_flips ^= 1
             
-            # This new flip ends at i+K
-            # We mark the end event
-            if i + K <= N:
-                flip_events[i + K] ^= 1
+            # This new flip ends at i+K, which reuses the same slot
+            flip_events[slot] = 1
+        else:
+            flip_events[slot] = 0
+
+        slot += 1
+        if slot == K:
+            slot = 0
 
     # 3. Check pass: Check elements from N-K+1 to N
     # These elements could not be the *start* of a flip
@@ -53,37 +69,143 @@ def calculate_min_flips(N, K, S):
     check_start_index = max(0, N - K + 1)
     
     for i in range(check_start_index, N):
-        active_flips ^= flip_events[i]
-        current_state = is_sad[i] ^ active_flips
+        active_flips ^= flip_events[slot]
+        slot += 1
+        if slot == K:
+            slot = 0
+        current_state = (S[i] == SAD) ^ active_flips
         
         if current_state == 1:
             # This student is 'S' and we can't fix it
-            return "-1"
+            return -1
 
     # If we get here, all students are 'H'
-    return str(total_operations)
+    return total_operations
+
+# "N S" on one line, for the all-K sweep
+SWEEP_PATTERN = re.compile(rb'\s*(\d+)\s+(\S+)')
+
+SAD_RUN = re.compile(rb'S+')
+
+def fold_is_zero(polynomial, K, length):
+    """
+    True if the GF(2) polynomial (bit p = coefficient of x^p, degree
+    below length) is divisible by x^K + 1, i.e. every residue class
+    mod K holds an even number of set bits. x^(K * 2^t) == 1 as well,
+    so the folding halves the width each round instead of peeling
+    off one K-bit chunk at a time.
+    """
+    width = K
+    while width * 2 < length:
+        width *= 2
+    while True:
+        mask = (1 << width) - 1
+        while polynomial >> width:
+            polynomial = (polynomial & mask) ^ (polynomial >> width)
+        if width == K:
+            return not polynomial
+        width //= 2
+
+def sweep_min_flips(N, S, window_sizes=None):
+    """
+    Minimum flip counts for many window sizes on one string: returns a
+    list with one answer (or -1) per K in window_sizes (default 1..N).
+
+    Flipping [i, i + K) toggles the sad/happy boundaries at i and i + K,
+    so K works iff every residue class mod K holds an even number of
+    boundaries, and then the flips are the gaps between consecutive
+    boundaries of a class, paired up and divided by K. The boundaries
+    are found once for all K; infeasible K are rejected by a bit-parallel
+    fold before the O(#boundaries) pairing pass.
+    """
+    if isinstance(S, str):
+        S = S.encode()
+    if window_sizes is None:
+        window_sizes = range(1, N + 1)
+
+    # Shared work: boundary positions in 0..N, as a list and as a polynomial
+    boundaries = []
+    for run in SAD_RUN.finditer(S[:N]):
+        boundaries.extend(run.span())
+    flags = bytearray(b'0') * (N + 1)
+    for position in boundaries:
+        flags[position] = ord('1')
+    polynomial = int(flags[::-1], 2)
+
+    answers = []
+    for K in window_sizes:
+        if not boundaries:
+            answers.append(0)
+            continue
+        if K <= 0 or K > N or not fold_is_zero(polynomial, K, N + 1):
+            answers.append(-1)
+            continue
+
+        total_operations = 0
+        unmatched = {} # residue -> boundary waiting for its partner
+        for position in boundaries:
+            start = unmatched.pop(position % K, None)
+            if start is None:
+                unmatched[position % K] = position
+            else:
+                total_operations += (position - start) // K
+        answers.append(total_operations)
+    return answers
+
+if profiling.ENABLED:
+    # Counting variants, swapped in only while profiling
+    _count_min_flips = count_min_flips
+    _sweep_min_flips = sweep_min_flips
+
+    def count_min_flips(N, K, S):
+        profiling.count("cases")
+        profiling.count("chars", N)
+        return _count_min_flips(N, K, S)
+
+    def sweep_min_flips(N, S, window_sizes=None):
+        answers = _sweep_min_flips(N, S, window_sizes)
+        profiling.count("cases")
+        profiling.count("chars", N)
+        profiling.count("window_sizes", len(answers))
+        profiling.count("feasible_window_sizes", sum(answer >= 0 for answer in answers))
+        return answers
+
+def run(reader, writer, argv=()):
+    """
+    Streams test cases from reader one line at a time and writes each
+    answer to writer; argv holds the mode flags.
+    """
+    readline = reader.readline
+    write = writer.write
 
-def main():
     try:
-        T = int(input())
-    except (IOError, ValueError):
+        T = int(readline())
+    except ValueError:
+        return
+
+    # With --all-k each case is "N S" and the answers for K = 1..N
+    # are written on one line
+    if "--all-k" in argv:
+        with profiling.phase("sweep"):
+            for _ in range(T):
+                case = SWEEP_PATTERN.match(readline())
+                if case is None:
+                    break
+                answers = sweep_min_flips(int(case[1]), case[2])
+                write(" ".join(map(str, answers)).encode() + b"\n")
         return
 
-    results = []
-    for _ in range(T):
-        try:
-            line = input().split()
-            if not line:
+    with profiling.phase("cases"):
+        for _ in range(T):
+            line = readline()
+            case = CASE_PATTERN.match(line)
+            if case is None:
                 break
-            N = int(line[0])
-            K = int(line[1])
-            S = line[2]
-        except (IOError, IndexError, ValueError):
-            break
-            
-        results.append(calculate_min_flips(N, K, S))
-        
-    output("\n".join(results) + "\n")
+            start, end = case.span(3)
+
+            write(b"%d\n" % count_min_flips(int(case[1]), int(case[2]), memoryview(line)[start:end]))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    writer = Writer()
+    run(TokenReader(), writer, sys.argv[1:])
+    writer.flush()
\ No newline at end of file
@@ -1,41 +1,15 @@
+import re
 import sys
-import threading
-
-# Increase recursion depth for DSU operations
-sys.setrecursionlimit(2 * 10**5) 
-
-class DisjointSetUnion:
-    """A DSU implementation using a dictionary for sparse grids."""
-    def __init__(self):
-        self.parent_map = {}
-        self.component_values = {}
-
-    def add_cell(self, cell_id, initial_value):
-        """Adds a new cell to the DSU as its own component."""
-        if cell_id not in self.parent_map:
-            self.parent_map[cell_id] = cell_id
-            self.component_values[cell_id] = [initial_value]
-
-    def find_root(self, cell_id):
-        """Finds the root of the component for cell_id with path compression."""
-        if self.parent_map[cell_id] == cell_id:
-            return cell_id
-        
-        root = self.find_root(self.parent_map[cell_id])
-        self.parent_map[cell_id] = root
-        return root
-
-    def merge_sets(self, cell_id_a, cell_id_b):
-        """Merges the sets containing cell_id_a and cell_id_b."""
-        root_a = self.find_root(cell_id_a)
-        root_b = self.find_root(cell_id_b)
-        
-        if root_a != root_b:
-            # Merge smaller component into larger (by convention, b into a)
-            self.parent_map[root_b] = root_a
-            # Move component values
-            self.component_values[root_a].extend(self.component_values[root_b])
-            del self.component_values[root_b]
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from xtreme19 import profiling
+from xtreme19.dsu import DisjointSetUnion
+from xtreme19.fastio import TokenReader, Writer
 
 def coords_to_id(r, c, M):
     """Encodes (row, col) coordinates into a unique integer ID."""
@@ -52,20 +26,222 @@ def link_symmetric_cells(cells, dsu, M):
         r2, c2 = cells[n - 1 - i]
         dsu.merge_sets(coords_to_id(r1, c1, M), coords_to_id(r2, c2, M))
 
-def solve():
+def best_digits_from_histograms(histograms):
     """
-    Main logic for the Palindrome Matrix problem.
+    Given 10 digit counts per component (flattened), returns the digit
+    minimizing the total change for each component: the lower weighted
+    median, which also breaks ties towards the smallest digit.
     """
-    N, M = map(int, sys.stdin.readline().split())
-    grid = [list(sys.stdin.readline().strip()) for _ in range(N)]
+    best_digits = bytearray(len(histograms) // 10)
+    for index in range(len(best_digits)):
+        counts = histograms[index * 10:index * 10 + 10]
+        half = (sum(counts) + 1) // 2
+        running = 0
+        for digit in range(10):
+            running += counts[digit]
+            if running >= half:
+                best_digits[index] = digit
+                break
+    return best_digits
 
-    dsu = DisjointSetUnion()
+# A horizontal word: a maximal run of digits
+WORD_PATTERN = re.compile(rb'[0-9]+')
 
-    # 1. Initialize DSU with all non-empty cells
-    for r in range(N):
-        for c in range(M):
-            if grid[r][c] != '.':
-                dsu.add_cell(coords_to_id(r, c, M), int(grid[r][c]))
+def symmetric_word_pairs(filled):
+    """
+    For a boolean (R, C) mask, finds every maximal horizontal run of
+    True cells (a word) and returns a (k, 2) int32 array with one row
+    per symmetric pair (i, n-1-i) of every word, as cell ids r*C + c.
+    """
+    R, C = filled.shape
+    # Pad each row with empty cells on both sides so words never touch
+    padded = np.zeros((R, C + 2), dtype=np.int8)
+    padded[:, 1:-1] = filled
+    steps = np.diff(padded.ravel())
+    # int32 indices keep the pair arrays small on large grids
+    starts = (np.flatnonzero(steps == 1) + 1).astype(np.int32)
+    ends = (np.flatnonzero(steps == -1) + 1).astype(np.int32) # exclusive
+
+    halves = (ends - starts) // 2
+    # i runs 0..half-1 within each word
+    offsets = np.arange(halves.sum(), dtype=np.int32)
+    offsets -= np.repeat(np.cumsum(halves, dtype=np.int32) - halves, halves)
+
+    # Positions in the padded layout map back via row * C + (col - 1)
+    width = C + 2
+    pairs = np.empty((len(offsets), 2), dtype=np.int32)
+    left = np.repeat(starts, halves) + offsets
+    pairs[:, 0] = left // width * C + left % width - 1
+    right = np.repeat(ends - 1, halves) - offsets
+    pairs[:, 1] = right // width * C + right % width - 1
+    return pairs
+
+def solve_vectorized(reader, writer):
+    """
+    Same as solve(), with the grid as a uint8 NumPy array: word
+    segmentation, pair generation, root finding and the per-component
+    digit histograms are all bulk array operations; only the unions
+    themselves run through the DSU.
+    """
+    N, M = reader.ints(2)
+    grid = np.frombuffer(b"".join(reader.tokens(N)), dtype=np.uint8).reshape(N, M)
+    filled = grid != ord('.')
+    profiling.lap("parse")
+
+    # 1. Initialize DSU: every cell starts as its own component
+    dsu = DisjointSetUnion(N * M)
+
+    # 2. Link symmetric cells in row-words
+    dsu.union_many(symmetric_word_pairs(filled))
+    profiling.lap("link_rows")
+
+    # 3. Link symmetric cells in column-words: rows of the transpose,
+    # whose ids c*N + r are mapped back to r*M + c
+    column_pairs = symmetric_word_pairs(filled.T)
+    column_pairs = column_pairs % N * M + column_pairs // N
+    dsu.union_many(column_pairs)
+    del column_pairs
+    profiling.lap("link_columns")
+
+    # 4. Resolve every root at once by pointer jumping, then build a
+    # 10-bin digit histogram per component
+    roots = np.frombuffer(dsu.parents, dtype=np.int32).copy()
+    while True:
+        jumped = roots[roots]
+        if np.array_equal(jumped, roots):
+            break
+        roots = jumped
+    flat_filled = filled.ravel()
+    cell_roots = roots[flat_filled]
+    # Number the distinct roots 0, 1, ... without sorting
+    is_root = np.zeros(N * M, dtype=bool)
+    is_root[cell_roots] = True
+    root_index = np.cumsum(is_root, dtype=np.int32) - 1
+    num_components = int(root_index[-1]) + 1 if N * M else 0
+    components = root_index[cell_roots]
+    del roots, jumped, is_root, root_index, cell_roots
+    digits = grid.ravel()[flat_filled] - ord('0')
+    histograms = np.bincount(components * 10 + digits, minlength=10 * num_components)
+    profiling.lap("histograms")
+    profiling.count("cells", N * M)
+    profiling.count("filled_cells", len(components))
+    profiling.count("components", num_components)
+
+    # 5. Optimal digit per component: the lower weighted median
+    cumulative = histograms.reshape(-1, 10).cumsum(axis=1)
+    half = (cumulative[:, -1] + 1) // 2
+    best_digits = (cumulative >= half[:, None]).argmax(axis=1)
+    profiling.lap("best_digits")
+
+    # 6. Output the result
+    result = np.empty((N, M + 1), dtype=np.uint8)
+    result[:, M] = ord('\n')
+    cells = grid.ravel().copy()
+    cells[flat_filled] = best_digits[components] + ord('0')
+    result[:, :M] = cells.reshape(N, M)
+    writer.write(result.tobytes())
+    profiling.lap("output")
+
+def solve_sparse(reader, writer):
+    """
+    Sparse variant for mostly-empty grids: each row is kept only as
+    run-length-encoded word spans, and only filled cells get DSU slots
+    (numbered in row-major order), so memory and time scale with the
+    number of filled cells rather than N * M.
+    """
+    readline = reader.readline
+    N, M = map(int, readline().split())
+
+    # 1. Run-length encode the rows: row_spans[r] holds one
+    # (start column, end column, first slot) triple per word
+    row_spans = []
+    cell_digits = bytearray()
+    for _ in range(N):
+        line = readline()
+        spans = []
+        for word in WORD_PATTERN.finditer(line, 0, M):
+            spans.append((word.start(), word.end(), len(cell_digits)))
+            cell_digits += word.group()
+        row_spans.append(spans)
+    dsu = DisjointSetUnion(len(cell_digits))
+    profiling.lap("parse")
+
+    # 2. Link symmetric cells in row-words: each span is one word
+    for spans in row_spans:
+        dsu.union_many(
+            (first + i, first + end - start - 1 - i)
+            for start, end, first in spans
+            for i in range((end - start) // 2)
+        )
+    profiling.lap("link_rows")
+
+    # 3. Link symmetric cells in column-words, carrying the open word
+    # of every column from one row to the next
+    open_words = {}
+    for spans in row_spans:
+        continued = {}
+        for start, end, first in spans:
+            for c in range(start, end):
+                word = open_words.pop(c, None)
+                if word is None:
+                    word = []
+                word.append(first + c - start)
+                continued[c] = word
+        # Columns without a cell in this row have finished their word
+        for word in open_words.values():
+            n = len(word)
+            dsu.union_many((word[i], word[n - 1 - i]) for i in range(n // 2))
+        open_words = continued
+    for word in open_words.values():
+        n = len(word)
+        dsu.union_many((word[i], word[n - 1 - i]) for i in range(n // 2))
+    profiling.lap("link_columns")
+
+    # 4. Group filled cells by component with 10-bin digit histograms
+    slot_component = array('i', bytes(4 * len(cell_digits)))
+    component_of_root = {}
+    histograms = array('i')
+    empty_histogram = array('i', [0]) * 10
+    for slot, digit in enumerate(cell_digits):
+        root = dsu.get_root(slot)
+        index = component_of_root.get(root)
+        if index is None:
+            index = len(component_of_root)
+            component_of_root[root] = index
+            histograms.extend(empty_histogram)
+        slot_component[slot] = index
+        histograms[index * 10 + digit - 48] += 1
+    profiling.lap("histograms")
+    profiling.count("cells", N * M)
+    profiling.count("filled_cells", len(cell_digits))
+    profiling.count("components", len(component_of_root))
+
+    # 5. Optimal digit per component, then per filled cell
+    best_digits = best_digits_from_histograms(histograms)
+    for slot in range(len(cell_digits)):
+        cell_digits[slot] = 48 + best_digits[slot_component[slot]]
+    profiling.lap("best_digits")
+
+    # 6. Output each row from its spans
+    for spans in row_spans:
+        row = bytearray(b'.') * M
+        for start, end, first in spans:
+            row[start:end] = cell_digits[first:first + end - start]
+        row += b'\n'
+        writer.write(row)
+    profiling.lap("output")
+
+def solve(reader, writer):
+    """
+    Main logic for the Palindrome Matrix problem.
+    """
+    N, M = map(int, reader.readline().split())
+    grid = [reader.readline().decode().strip() for _ in range(N)]
+    profiling.lap("parse")
+
+    # 1. Initialize DSU: every cell starts as its own component
+    # ('.' cells are never linked, so they simply stay alone)
+    dsu = DisjointSetUnion(N * M)
 
     # 2. Link symmetric cells in row-words
     for r in range(N):
@@ -81,6 +257,7 @@ def solve():
         # Process the last word in the row
         if current_word_coords:
             link_symmetric_cells(current_word_coords, dsu, M)
+    profiling.lap("link_rows")
 
     # 3. Link symmetric cells in column-words
     for c in range(M):
@@ -95,57 +272,58 @@ def solve():
         # Process the last word in the column
         if current_word_coords:
             link_symmetric_cells(current_word_coords, dsu, M)
+    profiling.lap("link_columns")
 
-    # 4. Create the result grid
-    result_grid = [row[:] for row in grid]
-    
-    # 5. Fill in the optimal digit for each component
-    # We only need the component values from the roots
-    for root_id, component_digits in dsu.component_values.items():
-        
-        # Find the digit (0-9) that minimizes the cost
-        # Key is a tuple: (total_cost, digit)
-        # This tie-breaks by choosing the smallest digit
-        best_digit = min(
-            range(10), 
-            key=lambda d: (sum(abs(d - x) for x in component_digits), d)
-        )
-        
-        # Get the (r, c) coords from the root_id
-        # (This is a bit of a hack, we just need one cell from the component)
-        r, c = divmod(root_id, M)
-        root_cell = (r, c) 
-        
-        # We need to fill all cells in this component
-        # We must re-iterate the grid to find all cells
-        # This is inefficient, but the original did this too (via groups)
-        
-    # Re-build the groups to fill the grid
-    # (The original did this, so we will too)
-    groups = {}
+    # 4. Single grouping pass: give every component a compact index
+    # and a 10-bin histogram of its digits
+    cell_component = array('i', [-1]) * (N * M)
+    component_of_root = {}
+    histograms = array('i')
+    empty_histogram = array('i', [0]) * 10
     for r in range(N):
-        for c in range(M):
-            if grid[r][c] != '.':
-                cell_id = coords_to_id(r,c,M)
-                root = dsu.find_root(cell_id)
-                if root not in groups:
-                    groups[root] = {'coords': [], 'digits': []}
-                groups[root]['coords'].append((r,c))
-                groups[root]['digits'].append(int(grid[r][c]))
-
-    for root_id, data in groups.items():
-        component_digits = data['digits']
-        best_digit = min(
-            range(10), 
-            key=lambda d: (sum(abs(d - x) for x in component_digits), d)
-        )
-        
-        for (r, c) in data['coords']:
-            result_grid[r][c] = str(best_digit)
+        row_offset = r * M
+        for c, cell in enumerate(grid[r]):
+            if cell != '.':
+                cell_id = row_offset + c
+                root = dsu.get_root(cell_id)
+                index = component_of_root.get(root)
+                if index is None:
+                    index = len(component_of_root)
+                    component_of_root[root] = index
+                    histograms.extend(empty_histogram)
+                cell_component[cell_id] = index
+                histograms[index * 10 + ord(cell) - 48] += 1
+    profiling.lap("histograms")
+    profiling.count("cells", N * M)
+    profiling.count("components", len(component_of_root))
 
-    # 6. Output the result
-    for row in result_grid:
-        print("".join(row))
+    # 5. Find the optimal digit for each component in O(10)
+    best_digits = best_digits_from_histograms(histograms)
+    digit_chars = [str(digit) for digit in best_digits]
+    profiling.lap("best_digits")
+
+    # 6. Output the result, filling each row from its cells' components
+    output_rows = []
+    for r in range(N):
+        row_offset = r * M
+        output_rows.append("".join([
+            cell if cell == '.' else digit_chars[cell_component[row_offset + c]]
+            for c, cell in enumerate(grid[r])
+        ]))
+    writer.write("\n".join(output_rows) + "\n")
+    profiling.lap("output")
+
+def run(reader, writer, argv=()):
+    """Solves the grid in reader into writer; argv holds the mode flags."""
+    with profiling.phase("solve"):
+        if "--sparse" in argv:
+            solve_sparse(reader, writer)
+        elif np is not None:
+            solve_vectorized(reader, writer)
+        else:
+            solve(reader, writer)
 
-# Run the main function in a new thread to avoid stack overflow
-threading.Thread(target=solve).start()
\ No newline at end of file
+if __name__ == "__main__":
+    writer = Writer()
+    run(TokenReader(), writer, sys.argv[1:])
+    writer.flush()
\ No newline at end of file
@@ -1,8 +1,9 @@
 import sys
+from collections import OrderedDict
+from functools import lru_cache, partial
 
-# Use fast I/O
-input = sys.stdin.readline
-output = sys.stdout.write
+from xtreme19 import profiling
+from xtreme19.fastio import TokenReader, Writer
 
 def inverse_mod_p(k, p):
     """
@@ -12,34 +13,47 @@ def inverse_mod_p(k, p):
     # pow(base, exponent, modulus) is efficient
     return pow(k, p - 2, p)
 
-def solve():
+def batch_inverse_mod_p(values, p):
     """
-    Reads curve parameters and points, computes P1 + P2.
+    Inverts every (non-zero) value mod p with Montgomery's trick:
+    one modular exponentiation plus 3(n-1) multiplications.
+    """
+    n = len(values)
+    if n == 0:
+        return []
+    # prefix[i] = values[0] * ... * values[i] mod p
+    prefix = [0] * n
+    running = 1
+    for i, value in enumerate(values):
+        running = running * value % p
+        prefix[i] = running
+
+    inverses = [0] * n
+    # Inverse of the whole product, peeled back one value at a time
+    inv_running = inverse_mod_p(running, p)
+    for i in range(n - 1, 0, -1):
+        inverses[i] = inv_running * prefix[i - 1] % p
+        inv_running = inv_running * values[i] % p
+    inverses[0] = inv_running
+    return inverses
+
+def slope_terms(a, p, x1, y1, x2, y2):
+    """
+    Classifies P1 + P2 on y^2 = x^3 + ax + b (mod p).
+    Returns None when the sum is the point at infinity, otherwise the
+    slope as a (numerator, denominator) pair with denominator != 0.
     """
-    try:
-        # Read a, b, p, x1, y1, x2, y2
-        params = list(map(int, input().split()))
-        if len(params) != 7:
-            return None # Stop processing
-        a, b, p, x1, y1, x2, y2 = params
-    except (IOError, ValueError):
-        return None # Stop processing
-
-    # --- Elliptic Curve Point Addition Logic ---
-
-    slope = 0
-    
     # Case 1: P1 + P2 = O (Point at Infinity)
     # This happens if x1 = x2 and y1 = -y2 mod p
     if x1 == x2 and y1 != y2:
         if y2 == (p - y1) % p:
-            return "POINT_AT_INFINITY"
+            return None
 
     # Case 2: Point Doubling (P1 = P2)
     if x1 == x2 and y1 == y2:
         # Sub-case: 2*P1 = O if y1 = 0 (vertical tangent)
         if y1 == 0:
-            return "POINT_AT_INFINITY"
+            return None
             
         # General Doubling: slope = (3*x1^2 + a) * (2*y1)^-1 mod p
         numerator = (3 * x1 * x1 + a) % p
@@ -51,12 +65,6 @@ def solve():
         numerator = (y2 - y1) % p
         denominator = (x2 - x1) % p
 
-    # --- Calculate slope and new coordinates ---
-
-    # Handle negative numerators/denominators before inverse
-    numerator = (numerator + p) % p
-    denominator = (denominator + p) % p
-
     # This check is crucial for Case 3, where denominator might be 0
     # if x1 = x2. But Case 1 and 2 should have already caught this.
     if denominator == 0:
@@ -64,9 +72,12 @@ def solve():
         # If it's Case 1 but y1 != -y2, it's an invalid state (two points
         # on a vertical line that aren't inverses).
         # We can treat this as infinity.
-        return "POINT_AT_INFINITY"
+        return None
+
+    return numerator, denominator
 
-    inv_denominator = inverse_mod_p(denominator, p)
+def finish_addition(p, x1, y1, x2, numerator, inv_denominator):
+    """Computes P3 = (x3, y3) from the slope and formats it."""
     slope = (numerator * inv_denominator) % p
 
     # Calculate coordinates of P3 = (x3, y3)
@@ -75,28 +86,342 @@ def solve():
       
     # y3 = slope * (x1 - x3) - y1 mod p
     y3 = (slope * (x1 - x3) - y1) % p
-
-    # Ensure coordinates are positive (0 to p-1)
-    x3 = (x3 + p) % p
-    y3 = (y3 + p) % p
         
     return f"{x3} {y3}"
 
-def main():
+# --- Jacobian coordinates ---
+# (X, Y, Z) stands for the affine point (X / Z^2, Y / Z^3);
+# Z = 0 is the point at infinity.
+
+JACOBIAN_INFINITY = (1, 1, 0)
+
+def jacobian_double(point, a, p):
+    """Computes 2 * point without any modular inverse."""
+    X, Y, Z = point
+    if Z == 0 or Y == 0:
+        # Doubling O, or a vertical tangent
+        return JACOBIAN_INFINITY
+    YY = Y * Y % p
+    S = 4 * X * YY % p
+    ZZ = Z * Z % p
+    M = (3 * X * X + a * ZZ * ZZ) % p
+    X3 = (M * M - 2 * S) % p
+    Y3 = (M * (S - X3) - 8 * YY * YY) % p
+    Z3 = 2 * Y * Z % p
+    return (X3, Y3, Z3)
+
+def jacobian_add(first, second, a, p):
+    """Computes first + second without any modular inverse."""
+    X1, Y1, Z1 = first
+    X2, Y2, Z2 = second
+    if Z1 == 0:
+        return second
+    if Z2 == 0:
+        return first
+    Z1Z1 = Z1 * Z1 % p
+    Z2Z2 = Z2 * Z2 % p
+    U1 = X1 * Z2Z2 % p
+    U2 = X2 * Z1Z1 % p
+    S1 = Y1 * Z2 * Z2Z2 % p
+    S2 = Y2 * Z1 * Z1Z1 % p
+    H = (U2 - U1) % p
+    R = (S2 - S1) % p
+    if H == 0:
+        # Same x: either the same point (double) or P + (-P) = O
+        if R == 0:
+            return jacobian_double(first, a, p)
+        return JACOBIAN_INFINITY
+    HH = H * H % p
+    HHH = H * HH % p
+    V = U1 * HH % p
+    X3 = (R * R - HHH - 2 * V) % p
+    Y3 = (R * (V - X3) - S1 * HHH) % p
+    Z3 = Z1 * Z2 * H % p
+    return (X3, Y3, Z3)
+
+def jacobian_to_affine(point, p):
+    """Converts back with the single modular inverse. None means O."""
+    X, Y, Z = point
+    if Z % p == 0:
+        return None
+    z_inv = inverse_mod_p(Z, p)
+    z_inv_squared = z_inv * z_inv % p
+    return (X * z_inv_squared % p, Y * z_inv_squared * z_inv % p)
+
+def naf_digits(k, width):
+    """Width-w NAF of k >= 0, least significant digit first."""
+    digits = []
+    window = 1 << width
+    while k:
+        if k & 1:
+            digit = k & (window - 1)
+            if digit >= window >> 1:
+                digit -= window
+            k -= digit
+        else:
+            digit = 0
+        digits.append(digit)
+        k >>= 1
+    return digits
+
+def scalar_multiply(a, p, k, x, y, width=4, double=None):
+    """
+    Computes k * (x, y) on y^2 = x^3 + ax + b (mod p) with width-w NAF
+    in Jacobian coordinates, so only one inverse is needed at the end.
+    Returns (x, y), or None for the point at infinity, matching what
+    repeated affine additions (slope_terms / finish_addition) give.
+    A curve-specific doubling (see CurveContext) may be passed in.
+    """
+    if double is None:
+        double = partial(jacobian_double, a=a, p=p)
+    if k < 0:
+        k, y = -k, (p - y) % p
+    base = (x % p, y % p, 1)
+
+    # Odd multiples P, 3P, 5P, ... for the non-zero digits
+    twice = double(base)
+    odd_multiples = [base]
+    for _ in range((1 << (width - 2)) - 1):
+        odd_multiples.append(jacobian_add(odd_multiples[-1], twice, a, p))
+
+    result = JACOBIAN_INFINITY
+    for digit in reversed(naf_digits(k, width)):
+        result = double(result)
+        if digit > 0:
+            result = jacobian_add(result, odd_multiples[digit >> 1], a, p)
+        elif digit < 0:
+            X, Y, Z = odd_multiples[-digit >> 1]
+            result = jacobian_add(result, (X, (p - Y) % p, Z), a, p)
+    return jacobian_to_affine(result, p)
+
+# --- Curve contexts ---
+
+CURVE_CACHE_SIZE = 64     # Curves kept by get_curve()
+BASE_TABLE_LIMIT = 16     # Fixed-base tables kept per curve
+HOT_BASE_THRESHOLD = 4    # Uses of a base point before it gets a table
+BASE_TABLE_WINDOW = 4     # Bits per window of a fixed-base table
+
+class CurveContext:
+    """
+    Everything reusable about y^2 = x^3 + ax + b (mod p): the reduced
+    coefficient a, the doubling formula that fits it, and fixed-base
+    tables for hot base points. b never enters the arithmetic; it only
+    tells curves apart. Get instances through get_curve() so repeated
+    work on the same curve skips this setup.
+    """
+    def __init__(self, a, b, p):
+        self.a = a % p
+        self.p = p
+        # Largest scalar a fixed-base table covers without falling back
+        self.table_bits = p.bit_length() + 1
+        # a = 0 and a = -3 have cheaper doubling formulas
+        if self.a == 0:
+            self.double = self._double_a_zero
+        elif self.a == p - 3:
+            self.double = self._double_a_minus_three
+        else:
+            self.double = self._double_generic
+        # (x, y) -> list of windows, each a list of affine points or None
+        self.base_tables = OrderedDict()
+        # (x, y) -> uses so far, least recently used first
+        self.base_uses = {}
+
+    def _double_generic(self, point):
+        return jacobian_double(point, self.a, self.p)
+
+    def _double_a_zero(self, point):
+        X, Y, Z = point
+        if Z == 0 or Y == 0:
+            return JACOBIAN_INFINITY
+        p = self.p
+        YY = Y * Y % p
+        S = 4 * X * YY % p
+        M = 3 * X * X % p
+        X3 = (M * M - 2 * S) % p
+        return (X3, (M * (S - X3) - 8 * YY * YY) % p, 2 * Y * Z % p)
+
+    def _double_a_minus_three(self, point):
+        X, Y, Z = point
+        if Z == 0 or Y == 0:
+            return JACOBIAN_INFINITY
+        p = self.p
+        YY = Y * Y % p
+        S = 4 * X * YY % p
+        ZZ = Z * Z % p
+        M = 3 * (X - ZZ) * (X + ZZ) % p
+        X3 = (M * M - 2 * S) % p
+        return (X3, (M * (S - X3) - 8 * YY * YY) % p, 2 * Y * Z % p)
+
+    def add(self, first, second):
+        """Jacobian addition on this curve."""
+        return jacobian_add(first, second, self.a, self.p)
+
+    def multiply(self, k, x, y):
+        """
+        k * (x, y) as (x, y), or None for the point at infinity. Base
+        points used HOT_BASE_THRESHOLD times get a fixed-base table.
+        """
+        p = self.p
+        key = (x % p, y % p)
+        table = self.base_tables.get(key)
+        if table is None:
+            # Re-inserted on every use, so the first entry is the stalest
+            uses = self.base_uses.pop(key, 0) + 1
+            if uses >= HOT_BASE_THRESHOLD:
+                table = self.precompute(*key)
+            else:
+                if len(self.base_uses) >= 4 * BASE_TABLE_LIMIT:
+                    del self.base_uses[next(iter(self.base_uses))]
+                self.base_uses[key] = uses
+        else:
+            self.base_tables.move_to_end(key)
+
+        if table is None or k < 0 or k.bit_length() > self.table_bits:
+            return scalar_multiply(self.a, p, k, x, y, double=self.double)
+        return self._multiply_fixed(table, k)
+
+    def precompute(self, x, y):
+        """
+        Builds (or refreshes) the fixed-base table of (x, y): window j
+        holds d * 2^(w*j) * P for d = 1 .. 2^w - 1, all in affine form
+        from one batch inversion. Evicts the least recently used table
+        once BASE_TABLE_LIMIT is reached.
+        """
+        p = self.p
+        key = (x % p, y % p)
+        table = self.base_tables.get(key)
+        if table is not None:
+            self.base_tables.move_to_end(key)
+            return table
+
+        w = BASE_TABLE_WINDOW
+        windows = -(-self.table_bits // w)
+        # 1. All multiples in Jacobian form
+        jacobian_points = []
+        window_base = (key[0], key[1], 1)
+        for _ in range(windows):
+            multiple = window_base
+            for _ in range((1 << w) - 1):
+                jacobian_points.append(multiple)
+                multiple = self.add(multiple, window_base)
+            # multiple is now 2^w * window_base
+            window_base = multiple
+
+        # 2. One shared inversion of every non-zero Z
+        zs = [Z for X, Y, Z in jacobian_points if Z]
+        inverses = iter(batch_inverse_mod_p(zs, p))
+        affine_points = []
+        for X, Y, Z in jacobian_points:
+            if Z:
+                z_inv = next(inverses)
+                z_inv_squared = z_inv * z_inv % p
+                affine_points.append((X * z_inv_squared % p, Y * z_inv_squared * z_inv % p, 1))
+            else:
+                affine_points.append(None)
+
+        # 3. Slice into windows and store with LRU eviction
+        size = (1 << w) - 1
+        table = [affine_points[i:i + size] for i in range(0, len(affine_points), size)]
+        if len(self.base_tables) >= BASE_TABLE_LIMIT:
+            self.base_tables.popitem(last=False)
+        self.base_tables[key] = table
+        return table
+
+    def _multiply_fixed(self, table, k):
+        """Sums one table entry per window: no doublings at all."""
+        w = BASE_TABLE_WINDOW
+        mask = (1 << w) - 1
+        result = JACOBIAN_INFINITY
+        for window in table:
+            if not k:
+                break
+            digit = k & mask
+            if digit:
+                point = window[digit - 1]
+                if point is not None:
+                    result = self.add(result, point)
+            k >>= w
+        return jacobian_to_affine(result, self.p)
+
+@lru_cache(maxsize=CURVE_CACHE_SIZE)
+def get_curve(a, b, p):
+    """The shared CurveContext for (a, b, p), least recently used first out."""
+    return CurveContext(a, b, p)
+
+def solve_batch(cases):
+    """
+    Solves many (a, b, p, x1, y1, x2, y2) cases at once. Cases are
+    grouped by modulus p so each group's slope denominators share one
+    Montgomery batch inversion. Results keep the input order.
+    """
+    results = ["POINT_AT_INFINITY"] * len(cases)
+    # p -> (case indices, numerators, denominators)
+    groups = {}
+    for index, (a, b, p, x1, y1, x2, y2) in enumerate(cases):
+        terms = slope_terms(a, p, x1, y1, x2, y2)
+        if terms is not None:
+            group = groups.get(p)
+            if group is None:
+                group = groups[p] = ([], [], [])
+            group[0].append(index)
+            group[1].append(terms[0])
+            group[2].append(terms[1])
+    profiling.lap("slopes")
+
+    for p, (indices, numerators, denominators) in groups.items():
+        inverses = batch_inverse_mod_p(denominators, p)
+        for index, numerator, inv_denominator in zip(indices, numerators, inverses):
+            a, b, p, x1, y1, x2, y2 = cases[index]
+            results[index] = finish_addition(p, x1, y1, x2, numerator, inv_denominator)
+    profiling.lap("inversion")
+    profiling.count("moduli", len(groups))
+    profiling.count("inverted_denominators", sum(len(group[0]) for group in groups.values()))
+    return results
+
+def solve_multiply(cases):
+    """
+    Solves many (a, b, p, k, x, y) cases, each k * (x, y) on its curve.
+    Curves come from get_curve(), so cases on the same curve share one
+    context, and base points that keep coming back get fixed-base tables.
+    """
+    results = []
+    for a, b, p, k, x, y in cases:
+        point = get_curve(a, b, p).multiply(k, x, y)
+        results.append("POINT_AT_INFINITY" if point is None else f"{point[0]} {point[1]}")
+    profiling.lap("multiply")
+    if profiling.ENABLED:
+        profiling.count("curve_cache_hits", get_curve.cache_info().hits)
+    return results
+
+def run(reader, writer, argv=()):
+    """
+    Reads all test cases up front and answers them with solve_batch(),
+    or with solve_multiply() under --multiply, where every case line is
+    "a b p k x y" instead.
+    """
     try:
-        T = int(input())
-    except (IOError, ValueError):
+        T = reader.int()
+    except ValueError:
         return
 
-    output_lines = []
-    for _ in range(T):
-        result = solve()
-        if result is None:
-            break
-        output_lines.append(result)
+    multiply = "--multiply" in argv
+    width = 6 if multiply else 7
+    with profiling.phase("solve"):
+        values = reader.tokens(width * T)
+        cases = []
+        for start in range(0, len(values) - width + 1, width):
+            try:
+                cases.append(tuple(map(int, values[start:start + width])))
+            except ValueError:
+                break # Stop processing
+        profiling.lap("parse")
+        profiling.count("cases", len(cases))
 
-    # Print all results at once
-    output('\n'.join(output_lines) + '\n')
+        results = solve_multiply(cases) if multiply else solve_batch(cases)
+        writer.write('\n'.join(results) + '\n')
+        profiling.lap("output")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    writer = Writer()
+    run(TokenReader(), writer, sys.argv[1:])
+    writer.flush()
\ No newline at end of file
@@ -1,93 +1,142 @@
 import sys
 
-# Use fast I/O
-input = sys.stdin.readline
-output = sys.stdout.write
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from xtreme19 import profiling
+from xtreme19.fastio import TokenReader, Writer
+
+# The original search tried exponents 0..62 only
+MAX_POWER_OF_TWO = 1 << 62
+
+# Rows formatted per output write in the batch path
+OUTPUT_CHUNK = 1 << 16
 
 def find_triplet(N):
     """
     Attempts to construct a triplet (A, B, C) for a given N.
     Returns (A, B, C) on success or None on failure.
+
+    Any power of two 2^k < N gives A = N + 2^k, B = N / 2 and
+    C = N / 2 - 2^k, provided C shares no bit with 2^k. Subtracting 2^k
+    from N / 2 leaves that bit clear exactly when N / 2 already has it
+    set, so the smallest valid 2^k is the lowest set bit of N / 2.
     """
-    
-    # Condition 1: N must be even
-    if N % 2 != 0:
+    # Condition 1: N must be even (and positive)
+    if N <= 0 or N % 2 != 0:
         return None
-    
+
     # Condition 2: N must not be a power of two
     # (N & (N - 1) == 0) is true if N is a power of two
     if N & (N - 1) == 0:
         return None
 
-    # Try iterating through powers of two
-    exponent = 0
-    while True:
-        power_of_two = 1 << exponent
-        
-        # Stop if 2^k >= N
-        if power_of_two >= N:
-            break
-            
-        remainder = N - power_of_two
-        
-        # We need (remainder - power_of_two) to be non-negative and even
-        if remainder >= power_of_two and (remainder - power_of_two) % 2 == 0:
-            
-            common_bits = (remainder - power_of_two) // 2
-            
-            # The 'and' part (common_bits) must not overlap with the 'xor' part (power_of_two)
-            if (common_bits & power_of_two) == 0:
-                
-                # We found a valid construction.
-                # Reconstruct x and y from their AND and XOR
-                # x = common_bits | power_of_two
-                # y = common_bits
-                x = common_bits | power_of_two
-                y = common_bits
-                
-                # Reconstruct A, B, C
-                A = N + power_of_two
-                B = x
-                C = y
-                
-                # Final safety checks (must be positive and distinct)
-                if A > 0 and B > 0 and C > 0 and A != B and B != C and A != C:
-                    # (Verification, not strictly needed)
-                    # if (A + B + C == 2 * N) and (A ^ B ^ C == N):
-                    return (A, B, C)
-                        
-        exponent += 1
-        # 63 bits is sufficient for 2^63 range
-        if exponent > 62:
-            break
-            
-    # No solution found
-    return None
-
-def main():
+    half = N >> 1
+    power_of_two = half & -half
+    if power_of_two > MAX_POWER_OF_TWO:
+        return None
+    return (N + power_of_two, half, half - power_of_two)
+
+def find_triplets(values):
     """
-    Reads the number of test cases and runs find_triplet for each.
+    Vectorized find_triplet over a uint64 array.
+    Returns (A, B, C, found); rows where found is False have no triplet.
+    A is computed in Python integers where N + 2^k overflows uint64.
+    """
+    one = np.uint64(1)
+    half = values >> one
+    power_of_two = half & (~half + one)
+    found = (values & one == 0) & (half & (half - one) != 0)
+    found &= power_of_two <= np.uint64(MAX_POWER_OF_TWO)
+
+    A = values + power_of_two
+    C = half - power_of_two
+    overflow = np.flatnonzero(found & (A < values))
+    if len(overflow):
+        A = A.astype(object)
+        A[overflow] = [int(n) + int(k) for n, k in zip(values[overflow].tolist(),
+                                                       power_of_two[overflow].tolist())]
+    return A, half, C, found
+
+def format_triplets(A, B, C, found):
+    """One "A B C" or "-1" line per row, as a single newline-terminated block."""
+    return "".join([f"{a} {b} {c}\n" if ok else "-1\n"
+                    for a, b, c, ok in zip(A.tolist(), B.tolist(), C.tolist(), found.tolist())])
+
+def solve(reader):
+    """
+    Reads the number of test cases and runs find_triplet for each,
+    one N per line (lines that do not parse are skipped).
     """
     try:
-        t = int(input())
-    except (IOError, ValueError):
+        t = int(reader.readline())
+    except ValueError:
         t = 0
-        
+
     output_lines = []
     for _ in range(t):
         try:
-            N = int(input())
-        except (IOError, ValueError):
+            N = int(reader.readline())
+        except ValueError:
             continue
-            
+
         result = find_triplet(N)
-        
+
         if result is None:
             output_lines.append("-1")
         else:
             output_lines.append(f"{result[0]} {result[1]} {result[2]}")
-            
-    output("\n".join(output_lines) + "\n")
+
+    return output_lines
+
+def solve_batch(reader):
+    """
+    NumPy path: parses every N into one uint64 array, answers them with
+    find_triplets() and yields the output in OUTPUT_CHUNK-row blocks.
+    Returns None when the input does not fit that shape (negative,
+    oversized or malformed values) so the caller can fall back to solve().
+    """
+    try:
+        values = reader.ints_array(dtype=np.uint64)
+    except ValueError:
+        return None
+    t = int(values[0]) if len(values) else 0
+    values = values[1:t + 1]
+    # fromstring saturates anything above 2^64 - 1
+    if len(values) < t or (values == np.uint64(2**64 - 1)).any():
+        return None
+    if t == 0:
+        return ["\n"]
+    profiling.lap("parse")
+
+    profiling.count("values", t)
+    A, B, C, found = find_triplets(values)
+    profiling.lap("construct")
+    if profiling.ENABLED:
+        profiling.count("triplets_found", int(found.sum()))
+    return (format_triplets(A[i:i + OUTPUT_CHUNK], B[i:i + OUTPUT_CHUNK],
+                            C[i:i + OUTPUT_CHUNK], found[i:i + OUTPUT_CHUNK])
+            for i in range(0, t, OUTPUT_CHUNK))
+
+def run(reader, writer, argv=()):
+    """Answers every N in reader into writer."""
+    start = reader.pos
+    with profiling.phase("solve"):
+        blocks = solve_batch(reader) if np is not None else None
+        if blocks is None:
+            reader.pos = start
+            lines = solve(reader)
+            profiling.lap("construct")
+            profiling.count("values", len(lines))
+            blocks = ["\n".join(lines) + "\n"]
+
+        for block in blocks:
+            writer.write(block)
+        profiling.lap("output")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    writer = Writer()
+    run(TokenReader(), writer, sys.argv[1:])
+    writer.flush()
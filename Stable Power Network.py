@@ -1,115 +1,529 @@
+import os
 import sys
+import copy
 import heapq
+from bisect import bisect_right
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-# Set higher recursion depth for DSU
-sys.setrecursionlimit(400000)
-
-class DisjointSetUnion:
-    """Standard DSU implementation with path compression and union-by-size."""
-    def __init__(self, n):
-        self.parents = list(range(n))
-        self.sizes = [1] * n
-
-    def get_root(self, i):
-        """Find the root of i with path compression."""
-        if self.parents[i] == i:
-            return i
-        self.parents[i] = self.get_root(self.parents[i])
-        return self.parents[i]
-
-    def merge_sets(self, i, j):
-        """Merge the sets containing i and j. Return True if merged."""
-        root_i = self.get_root(i)
-        root_j = self.get_root(j)
-        
-        if root_i != root_j:
-            # Union by size
-            if self.sizes[root_i] < self.sizes[root_j]:
-                root_i, root_j = root_j, root_i
-            self.parents[root_j] = root_i
-            self.sizes[root_i] += self.sizes[root_j]
-            return True
-        return False
-
-def find_shortest_time(start_node, end_node, num_nodes, graph):
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from xtreme19.dsu import DisjointSetUnion
+from xtreme19 import profiling, solvers
+from xtreme19.fastio import TokenReader, Writer
+
+# With fewer cases than this, --parallel solves them in-process: the
+# pool's start-up and pickling would cost more than it saves
+PARALLEL_MIN_CASES = 4
+
+# Chunks handed out per worker; more chunks even out the tail
+CHUNKS_PER_WORKER = 4
+
+if profiling.ENABLED:
+    def counted_heappush(heap, item):
+        profiling.count("heap_pushes")
+        heapq.heappush(heap, item)
+else:
+    counted_heappush = heapq.heappush
+
+class EdgeColumns:
     """
-    Standard Dijkstra's algorithm to find shortest time.
+    Edge list stored as four parallel array('q') columns
+    (sources, targets, times, risks) instead of per-edge lists.
+    """
+    def __init__(self, sources, targets, times, risks):
+        self.sources = sources
+        self.targets = targets
+        self.times = times
+        self.risks = risks
+
+    def __len__(self):
+        return len(self.risks)
+
+    def sorted_by_risk(self):
+        """Returns the same edges reordered by ascending risk (stable)."""
+        if np is not None:
+            order = np.argsort(np.frombuffer(self.risks, dtype=np.int64), kind='stable')
+            columns = []
+            for column in (self.sources, self.targets, self.times, self.risks):
+                reordered = array('q')
+                reordered.frombytes(np.frombuffer(column, dtype=np.int64)[order].tobytes())
+                columns.append(reordered)
+            return EdgeColumns(*columns)
+
+        order = sorted(range(len(self.risks)), key=self.risks.__getitem__)
+        return EdgeColumns(*(
+            array('q', map(column.__getitem__, order))
+            for column in (self.sources, self.targets, self.times, self.risks)
+        ))
+
+    def prefix(self, count):
+        """The first count edges."""
+        return EdgeColumns(
+            self.sources[:count], self.targets[:count],
+            self.times[:count], self.risks[:count],
+        )
+
+def read_network(reader):
+    """
+    Reads "N M" followed by M rows of "u v time risk" from reader.
+    Returns (N, risk-sorted EdgeColumns), or None if the input is
+    truncated.
+    """
+    header = reader.ints(2)
+    if len(header) < 2:
+        return None
+    N, M = header
+    block = reader.ints(4 * M)
+    if len(block) < 4 * M:
+        return None
+    # Every 4th value of the block belongs to the same column
+    edges = EdgeColumns(block[0::4], block[1::4], block[2::4], block[3::4])
+    return N, edges.sorted_by_risk()
+
+class CompressedGraph:
+    """
+    Undirected weighted graph in compressed-sparse-row form.
+    The neighbours of u are neighbors[offsets[u]:ends[u]], with the
+    matching edge times and risks in weights and risks.
+    Built from risk-sorted EdgeColumns, so each adjacency slice is
+    sorted by risk as well.
+    """
+    def __init__(self, num_nodes, edges):
+        # Count degrees, turn them into offsets, then scatter both
+        # directions of every edge into the flat arrays.
+        offsets = array('q', bytes(8 * (num_nodes + 2)))
+        for u in edges.sources:
+            offsets[u + 1] += 1
+        for v in edges.targets:
+            offsets[v + 1] += 1
+        for u in range(1, num_nodes + 2):
+            offsets[u] += offsets[u - 1]
+
+        num_slots = offsets[num_nodes + 1]
+        neighbors = array('i', bytes(4 * num_slots))
+        weights = array('q', bytes(8 * num_slots))
+        risks = array('q', bytes(8 * num_slots))
+        fill = array('q', offsets)
+        for u, v, time, risk in zip(edges.sources, edges.targets, edges.times, edges.risks):
+            slot = fill[u]
+            neighbors[slot] = v
+            weights[slot] = time
+            risks[slot] = risk
+            fill[u] = slot + 1
+            slot = fill[v]
+            neighbors[slot] = u
+            weights[slot] = time
+            risks[slot] = risk
+            fill[v] = slot + 1
+
+        self.num_nodes = num_nodes
+        self.offsets = offsets
+        self.ends = offsets[1:]
+        self.neighbors = neighbors
+        self.weights = weights
+        self.risks = risks
+
+    def restricted(self, max_risk):
+        """
+        Returns a view of the graph keeping only edges with
+        risk <= max_risk. The edge arrays are shared; only the
+        per-node end slots are recomputed.
+        """
+        offsets = self.offsets
+        risks = self.risks
+        ends = array('q', self.ends)
+        for u in range(1, self.num_nodes + 1):
+            ends[u] = bisect_right(risks, max_risk, offsets[u], offsets[u + 1])
+
+        view = copy.copy(self)
+        view.ends = ends
+        return view
+
+def find_shortest_times(start_node, end_nodes, graph):
     """
-    min_times = [float('inf')] * (num_nodes + 1)
+    Dijkstra's algorithm over a CompressedGraph.
+    Returns the shortest time to each of end_nodes (-1 if unreachable),
+    stopping as soon as all of them are settled.
+    Heap entries are packed as (time << shift) | node so no tuples
+    are allocated per relaxation.
+    """
+    num_nodes = graph.num_nodes
+    offsets = graph.offsets
+    ends = graph.ends
+    neighbors = graph.neighbors
+    weights = graph.weights
+
+    is_target = bytearray(num_nodes + 1)
+    for node in end_nodes:
+        is_target[node] = 1
+    targets_left = sum(is_target)
+
+    unreached = -1
+    min_times = array('q', [unreached]) * (num_nodes + 1)
     min_times[start_node] = 0
-    # Priority queue stores (time, node)
-    priority_queue = [(0, start_node)]
+    shift = (num_nodes + 1).bit_length()
+    node_mask = (1 << shift) - 1
+    # Priority queue stores packed (time, node) keys
+    priority_queue = [start_node]
+    heappush = counted_heappush
+    heappop = heapq.heappop
 
     while priority_queue:
-        time, u = heapq.heappop(priority_queue)
+        key = heappop(priority_queue)
+        time = key >> shift
+        u = key & node_mask
 
         if time > min_times[u]:
             continue
-        
-        if u == end_node:
-            # Found the shortest path to the end
-            return min_times[end_node]
-
-        for v, w in graph[u]:
-            if min_times[u] + w < min_times[v]:
-                min_times[v] = min_times[u] + w
-                heapq.heappush(priority_queue, (min_times[v], v))
-    
-    return min_times[end_node]
 
-def run_test_case():
+        if is_target[u]:
+            is_target[u] = 0
+            targets_left -= 1
+            if not targets_left:
+                # Every requested node has its final time
+                break
+
+        for slot in range(offsets[u], ends[u]):
+            v = neighbors[slot]
+            candidate = time + weights[slot]
+            best = min_times[v]
+            if best == unreached or candidate < best:
+                min_times[v] = candidate
+                heappush(priority_queue, (candidate << shift) | v)
+
+    return [min_times[node] for node in end_nodes]
+
+def find_shortest_time(start_node, end_node, graph):
     """
-    Solves a single test case for the Stable Power Network.
+    Standard Dijkstra's algorithm to find shortest time.
     """
-    input = sys.stdin.readline
-    
-    try:
-        N, M = map(int, input().split())
-        all_edges = []
-        for _ in range(M):
-            # u, v, time, risk
-            all_edges.append(list(map(int, input().split())))
-    except (IOError, ValueError):
-        return
+    return find_shortest_times(start_node, (end_node,), graph)[0]
 
-    # 1. Sort all edges by risk
-    all_edges.sort(key=lambda edge: edge[3])
+class KruskalTree:
+    """
+    Kruskal reconstruction tree over risk-sorted EdgeColumns.
+    Leaves are the nodes 1..N; each merging edge adds an internal node
+    whose value is that edge's risk. The minimum bottleneck risk between
+    two nodes is the value at their lowest common ancestor.
+    """
+    def __init__(self, num_nodes, sorted_edges):
+        size = 2 * num_nodes
+        parent = array('i', bytes(4 * size))
+        node_risk = array('q', bytes(8 * size))
+        dsu = DisjointSetUnion(num_nodes + 1)
+        # top_node[root] is the tree node standing for that DSU set
+        top_node = array('i', range(num_nodes + 1))
+
+        next_node = num_nodes + 1
+        for u, v, risk in zip(sorted_edges.sources, sorted_edges.targets, sorted_edges.risks):
+            root_u = dsu.get_root(u)
+            root_v = dsu.get_root(v)
+            if root_u == root_v:
+                continue
+            parent[top_node[root_u]] = next_node
+            parent[top_node[root_v]] = next_node
+            node_risk[next_node] = risk
+            dsu.merge_sets(root_u, root_v)
+            top_node[dsu.get_root(root_u)] = next_node
+            next_node += 1
+            if next_node == size:
+                # The tree is spanning, later edges cannot merge anything
+                break
+
+        # Parents always have larger ids than their children, so one
+        # descending pass fills in depths. Roots point to themselves.
+        depth = array('i', bytes(4 * size))
+        for node in range(next_node - 1, 0, -1):
+            if parent[node]:
+                depth[node] = depth[parent[node]] + 1
+            else:
+                parent[node] = node
+
+        # Binary lifting table: ancestors[j][x] is the 2^j-th ancestor of x
+        ancestors = [parent]
+        for _ in range(max(1, next_node.bit_length() - 1)):
+            previous = ancestors[-1]
+            ancestors.append(array('i', [previous[previous[x]] for x in range(size)]))
+
+        self.dsu = dsu
+        self.depth = depth
+        self.node_risk = node_risk
+        self.ancestors = ancestors
 
+    def bottleneck_risk(self, u, v):
+        """
+        Minimum possible maximum risk over paths from u to v,
+        or -1 if they are not connected.
+        """
+        if self.dsu.get_root(u) != self.dsu.get_root(v):
+            return -1
+        if u == v:
+            return 0
+
+        depth = self.depth
+        ancestors = self.ancestors
+        if depth[u] < depth[v]:
+            u, v = v, u
+        # Lift u to the depth of v
+        gap = depth[u] - depth[v]
+        level = 0
+        while gap:
+            if gap & 1:
+                u = ancestors[level][u]
+            gap >>= 1
+            level += 1
+        if u == v:
+            return self.node_risk[u]
+        # Lift both just below their lowest common ancestor
+        for level in range(len(ancestors) - 1, -1, -1):
+            step = ancestors[level]
+            if step[u] != step[v]:
+                u = step[u]
+                v = step[v]
+        return self.node_risk[ancestors[0][u]]
+
+def run_test_case(N, all_edges):
+    """
+    Solves a single test case for the Stable Power Network.
+    all_edges is already sorted by risk (step 1, done while reading).
+    """
     dsu = DisjointSetUnion(N + 1)
     bottleneck_risk = -1
 
     # 2. Find the minimum bottleneck risk using a Kruskal-like approach
-    for u, v, time, risk in all_edges:
-        dsu.merge_sets(u, v)
-        # As soon as 1 and N are connected, the current edge's
-        # risk is the minimum maximum risk for *some* path.
-        if dsu.get_root(1) == dsu.get_root(N):
-            bottleneck_risk = risk
-            break
+    with profiling.phase("kruskal"):
+        for u, v, risk in zip(all_edges.sources, all_edges.targets, all_edges.risks):
+            dsu.merge_sets(u, v)
+            # As soon as 1 and N are connected, the current edge's
+            # risk is the minimum maximum risk for *some* path.
+            if dsu.get_root(1) == dsu.get_root(N):
+                bottleneck_risk = risk
+                break
 
     # 3. Handle the case where 1 and N are never connected
     if bottleneck_risk == -1:
-        print("-1")
-        return
+        return "-1"
 
     # 4. Build the time-based graph
-    # Include only edges with risk <= our bottleneck_risk
-    time_graph = [[] for _ in range(N + 1)]
-    for u, v, time, risk in all_edges:
-        if risk <= bottleneck_risk:
-            time_graph[u].append((v, time))
-            time_graph[v].append((u, time))
-            
+    # Edges are sorted by risk, so the ones with risk <= bottleneck_risk
+    # form a prefix of all_edges.
+    with profiling.phase("build_graph"):
+        usable_edges = bisect_right(all_edges.risks, bottleneck_risk)
+        time_graph = CompressedGraph(N, all_edges.prefix(usable_edges))
+    profiling.count("graph_edges", usable_edges)
+
     # 5. Run Dijkstra on the time_graph to find the shortest time
-    final_time = find_shortest_time(1, N, N, time_graph)
+    with profiling.phase("dijkstra"):
+        final_time = find_shortest_time(1, N, time_graph)
     
-    print(f"{bottleneck_risk} {final_time}")
+    return f"{bottleneck_risk} {final_time}"
 
-# --- Main execution ---
-try:
-    T = int(sys.stdin.readline())
-except (IOError, ValueError):
-    T = 0
-    
-for _ in range(T):
-    run_test_case()
\ No newline at end of file
+def run_query_case(N, all_edges, queries):
+    """
+    Solves a network followed by Q (source, target) queries.
+    The reconstruction tree and the CSR graph are built once; queries
+    sharing a bottleneck risk reuse one restricted view of the graph,
+    and queries sharing a source as well reuse one Dijkstra run.
+    A query with s == t is answered like run_test_case with N == 1:
+    its risk is that of the cheapest edge (-1 without edges), time 0.
+    Returns "" when Q is 0.
+    """
+    Q = len(queries)
+    if not Q:
+        return ""
+
+    # 2. Bottleneck risk of every query from the reconstruction tree
+    with profiling.phase("kruskal_tree"):
+        tree = KruskalTree(N, all_edges)
+    # run_test_case merges the cheapest edge before its first check
+    same_node_risk = all_edges.risks[0] if len(all_edges) else -1
+    with profiling.phase("bottlenecks"):
+        query_risks = [same_node_risk if s == t else tree.bottleneck_risk(s, t)
+                       for s, t in queries]
+    profiling.count("queries", Q)
+
+    # 3. Group connected queries by risk threshold, then by source
+    batches = {}
+    for index, (s, t) in enumerate(queries):
+        risk = query_risks[index]
+        if risk != -1:
+            batches.setdefault(risk, {}).setdefault(s, []).append(index)
+
+    # 4. One Dijkstra per (threshold, source) over a restricted view
+    query_times = [0] * Q
+    with profiling.phase("build_graph"):
+        full_graph = CompressedGraph(N, all_edges)
+    with profiling.phase("dijkstra"):
+        for risk, by_source in batches.items():
+            time_graph = full_graph.restricted(risk)
+            for s, indices in by_source.items():
+                targets = [queries[index][1] for index in indices]
+                times = find_shortest_times(s, targets, time_graph)
+                for index, time in zip(indices, times):
+                    query_times[index] = time
+    profiling.count("dijkstra_runs", sum(len(by_source) for by_source in batches.values()))
+
+    # 5. One line per query
+    answers = []
+    for index in range(Q):
+        if query_risks[index] == -1:
+            answers.append("-1")
+        else:
+            answers.append(f"{query_risks[index]} {query_times[index]}")
+    return "\n".join(answers)
+
+def read_cases(reader, query_mode=False):
+    """
+    Yields the test cases one at a time as (N, risk-sorted edges,
+    queries) triples, parsing each only when it is asked for; queries
+    is a list of (source, target) pairs in query_mode (each network
+    followed by Q lines of "source target"), else None. Stops at the
+    first truncated or malformed case.
+    """
+    try:
+        T = reader.int()
+    except ValueError:
+        return
+
+    for _ in range(T):
+        try:
+            network = read_network(reader)
+            if network is None:
+                break
+            N, all_edges = network
+            queries = None
+            if query_mode:
+                Q = reader.int()
+                pairs = reader.ints(2 * Q)
+                queries = list(zip(pairs[0::2], pairs[1::2]))
+        except ValueError:
+            break
+        yield N, all_edges, queries
+
+def solve_case(case):
+    """
+    Answers one parsed case; returns its output lines as one string
+    ("" if it has none).
+    """
+    N, all_edges, queries = case
+    if queries is None:
+        return run_test_case(N, all_edges)
+    return run_query_case(N, all_edges, queries)
+
+def case_cost(case):
+    """
+    Rough work estimate for one case: Kruskal and Dijkstra both scale
+    with N + M, and query mode runs up to one Dijkstra per query.
+    """
+    N, all_edges, queries = case
+    cost = N + len(all_edges)
+    if queries is not None:
+        cost *= 1 + len(queries)
+    return cost
+
+def balanced_chunks(cases, num_chunks):
+    """
+    Splits the case indices into at most num_chunks lists of similar
+    total cost: largest case first, each into the lightest chunk so far.
+    """
+    loads = [(0, chunk) for chunk in range(min(num_chunks, len(cases)))]
+    chunks = [[] for _ in loads]
+    for index in sorted(range(len(cases)), key=lambda index: -case_cost(cases[index])):
+        load, chunk = heapq.heappop(loads)
+        chunks[chunk].append(index)
+        heapq.heappush(loads, (load + case_cost(cases[index]), chunk))
+    return [sorted(chunk) for chunk in chunks if chunk]
+
+def solve_chunk(chunk):
+    """
+    Worker side: answers a list of parsed cases. Returns the outputs
+    and, when profiling, this chunk's phases and counters (else None).
+    """
+    # Drop anything inherited from the parent or left by an earlier chunk
+    profiling.take()
+    outputs = [solve_case(case) for case in chunk]
+    return outputs, profiling.take()
+
+def solve_parallel(cases, workers=None):
+    """
+    Answers the parsed cases over a process pool of workers (default:
+    one per CPU); returns the outputs in case order. Cases travel as
+    their EdgeColumns arrays, which pickle as flat buffers. Few cases
+    or a single worker fall back to solving in-process. When profiling,
+    the workers' phases and counters are merged into this process's,
+    with phase times summed over the workers.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(cases) < PARALLEL_MIN_CASES:
+        return [solve_case(case) for case in cases]
+
+    chunks = balanced_chunks(cases, workers * CHUNKS_PER_WORKER)
+    profiling.count("chunks", len(chunks))
+    pool_options = {}
+    if __name__.startswith("xtreme19_solver_"):
+        # Loaded by path through xtreme19.solvers: workers that do not
+        # fork must import it the same way before unpickling solve_chunk
+        pool_options = {"initializer": solvers.load, "initargs": ("stable-power",)}
+
+    outputs = [None] * len(cases)
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), **pool_options) as pool:
+        futures = {pool.submit(solve_chunk, [cases[index] for index in chunk]): chunk
+                   for chunk in chunks}
+        for future in as_completed(futures):
+            chunk_outputs, chunk_profile = future.result()
+            for index, output in zip(futures[future], chunk_outputs):
+                outputs[index] = output
+            if chunk_profile is not None:
+                profiling.merge(chunk_profile)
+    return outputs
+
+def parallel_workers(argv):
+    """
+    Worker count requested by the flags: "--workers N" sets it, bare
+    "--parallel" means one per CPU (0); None without either flag.
+    """
+    if "--workers" in argv:
+        return int(argv[argv.index("--workers") + 1])
+    if "--parallel" in argv:
+        return 0
+    return None
+
+def run(reader, writer, argv=()):
+    """
+    Answers every case in reader into writer; argv holds the mode flags.
+    Each case is solved and written as soon as it is parsed, so only one
+    network is in memory at a time. With --parallel (or --workers N) all
+    cases are parsed first, solved over a process pool and written once
+    all are done, still in input order.
+    """
+    workers = parallel_workers(argv)
+    cases = read_cases(reader, "--queries" in argv)
+    if workers is not None:
+        with profiling.phase("parse"):
+            cases = list(cases)
+        profiling.count("cases", len(cases))
+        with profiling.phase("solve"):
+            for output in solve_parallel(cases, workers):
+                if output:
+                    writer.write(output + "\n")
+        return
+
+    while True:
+        with profiling.phase("parse"):
+            case = next(cases, None)
+        if case is None:
+            break
+        profiling.count("cases")
+        with profiling.phase("solve"):
+            output = solve_case(case)
+            if output:
+                writer.write(output + "\n")
+
+if __name__ == "__main__":
+    writer = Writer()
+    run(TokenReader(), writer, sys.argv[1:])
+    writer.flush()
@@ -0,0 +1,5 @@
+"""
+Benchmark suite for the solver scripts: seeded worst-case input
+generators (generators.py) and a timing / memory harness with a JSON
+baseline (run.py). Run it with "python -m bench.run".
+"""
@@ -0,0 +1,241 @@
+"""
+Seeded generators for worst-case inputs of every solver.
+
+Each generator takes a random.Random and a scale factor (1.0 is the
+full benchmark size) and returns a Workload. Sizes are chosen at or near
+the problem limits, shaped to hit each solver's slowest path.
+"""
+import random
+from collections import namedtuple
+
+# script: solver file name; args: extra command-line flags;
+# data: the input bytes; units / unit: the amount of work, for throughput
+Workload = namedtuple("Workload", "script args data units unit")
+
+def scaled(value, scale, minimum=1):
+    return max(minimum, int(value * scale))
+
+def airline(rng, scale):
+    """
+    Dense fares (every city priced, 200k distinct-ish values) under a
+    budget large enough that the bitset build dominates.
+    """
+    n = scaled(200_000, scale, 2)
+    k = scaled(2_000_000, scale)
+    q = scaled(200_000, scale)
+    lines = [f"{n} {k}", " ".join(str(rng.randint(1, 1_000_000)) for _ in range(n - 1)), str(q)]
+    lines += [f"{rng.randrange(n)} {rng.randrange(n)}" for _ in range(q)]
+    return Workload("Airline Travelling.py", [], ("\n".join(lines) + "\n").encode(), n + q, "cities+queries")
+
+def airline_large_k(rng, scale):
+    """
+    A budget far beyond any bitset, forcing the residue engine. Its
+    setup grows with cheapest fare * distinct fares, so fares stay in
+    the low thousands.
+    """
+    n = scaled(200_000, scale, 2)
+    q = scaled(200_000, scale)
+    lines = [f"{n} {10 ** 13}", " ".join(str(rng.randint(1_000, 5_000)) for _ in range(n - 1)), str(q)]
+    lines += [f"{rng.randrange(n)} {rng.randrange(n)}" for _ in range(q)]
+    return Workload("Airline Travelling.py", [], ("\n".join(lines) + "\n").encode(), n + q, "cities+queries")
+
+def airline_budgets(rng, scale):
+    """
+    Per-query budgets (--budgets): one bitset up to the largest budget
+    answers every query, most of them far below it.
+    """
+    n = scaled(200_000, scale, 2)
+    q = scaled(200_000, scale)
+    top = scaled(2_000_000, scale)
+    lines = [str(n), " ".join(str(rng.randint(1, 1_000_000)) for _ in range(n - 1)), str(q)]
+    lines += [f"{rng.randrange(n)} {rng.randrange(n)} {rng.randint(0, top)}" for _ in range(q)]
+    return Workload("Airline Travelling.py", ["--budgets"], ("\n".join(lines) + "\n").encode(),
+                    n + q, "cities+queries")
+
+def expectation(rng, scale):
+    """Full-rank 60-bit XOR bases, so the span has 2^60 values."""
+    cases = []
+    n = scaled(250_000, scale)
+    for K in (1, 2, 3, 4):
+        values = " ".join(str(rng.getrandbits(60)) for _ in range(n))
+        cases.append(f"{n} {K}\n{values}\n")
+    return Workload("Do You Know Expectation.py", [], "".join(cases).encode(), 4 * n, "values")
+
+def expectation_moments(rng, scale):
+    """
+    Several moments per case (--moments): a full-rank 60-bit basis
+    (bit expansion) and a 16-bit one (enumeration of the span).
+    """
+    cases = []
+    n = scaled(250_000, scale)
+    for bits, exponents in ((60, "0 1 2 3 4"), (16, "5 1 9 3 7 2"), (60, "4 2")):
+        values = " ".join(str(rng.getrandbits(bits)) for _ in range(n))
+        cases.append(f"{n} {len(exponents.split())}\n{values}\n{exponents}\n")
+    return Workload("Do You Know Expectation.py", ["--moments"], "".join(cases).encode(), 3 * n, "values")
+
+def magic_wands(rng, scale):
+    """Long strings with dense, alternating sad runs and mixed window sizes."""
+    T = 8
+    N = scaled(500_000, scale)
+    lines = [str(T)]
+    for case in range(T):
+        if case % 2:
+            S = ("SH" * (N // 2 + 1))[:N]
+        else:
+            S = "".join("S" if rng.random() < 0.5 else "H" for _ in range(N))
+        K = (1, 2, 3, N // 2, N // 3, rng.randint(1, N), 7, N)[case]
+        lines.append(f"{N} {max(K, 1)} {S}")
+    return Workload("Magic Wands.py", [], ("\n".join(lines) + "\n").encode(), T * N, "chars")
+
+def magic_wands_all_k(rng, scale):
+    """The all-K sweep over random strings."""
+    T = 4
+    N = scaled(100_000, scale)
+    lines = [str(T)]
+    for _ in range(T):
+        lines.append(f"{N} " + "".join("S" if rng.random() < 0.5 else "H" for _ in range(N)))
+    return Workload("Magic Wands.py", ["--all-k"], ("\n".join(lines) + "\n").encode(), T * N, "chars")
+
+def palindrome(rng, scale):
+    """An all-filled grid: every row and column is one long word."""
+    N = M = scaled(2000, scale)
+    digits = "0123456789"
+    lines = [f"{N} {M}"]
+    lines += ["".join(rng.choice(digits) for _ in range(M)) for _ in range(N)]
+    return Workload("Palidrome Matrix.py", [], ("\n".join(lines) + "\n").encode(), N * M, "cells")
+
+def palindrome_sparse(rng, scale):
+    """A mostly empty grid (--sparse): short words and about 10% filled."""
+    N = M = scaled(2000, scale)
+    lines = [f"{N} {M}"]
+    for _ in range(N):
+        row = bytearray(b".") * M
+        for _ in range(M // 40):
+            start = rng.randrange(M)
+            length = rng.randint(1, 8)
+            row[start:start + length] = bytes(rng.choice(b"0123456789") for _ in range(len(row[start:start + length])))
+        lines.append(row.decode())
+    return Workload("Palidrome Matrix.py", ["--sparse"], ("\n".join(lines) + "\n").encode(), N * M, "cells")
+
+def stable_power(rng, scale):
+    """One dense connected graph with distinct-ish risks."""
+    n = scaled(5_000, scale, 2)
+    m = max(n - 1, scaled(1_000_000, scale))
+    lines = ["1", f"{n} {m}"]
+    lines += [f"{i} {i + 1} {rng.randint(1, 1000)} {rng.randint(1, 10 ** 9)}" for i in range(1, n)]
+    lines += [f"{rng.randint(1, n)} {rng.randint(1, n)} {rng.randint(1, 1000)} {rng.randint(1, 10 ** 9)}"
+              for _ in range(m - n + 1)]
+    return Workload("Stable Power Network.py", [], ("\n".join(lines) + "\n").encode(), m, "edges")
+
+def stable_power_queries(rng, scale):
+    """
+    Offline queries (--queries): few risk levels and a handful of hub
+    sources, so batches share Dijkstra runs; s == t pairs included.
+    """
+    T = 2
+    n = scaled(2_000, scale, 2)
+    m = max(n - 1, scaled(20_000, scale))
+    q = scaled(20_000, scale)
+    hubs = [rng.randint(1, n) for _ in range(10)]
+    lines = [str(T)]
+    for _ in range(T):
+        lines.append(f"{n} {m}")
+        lines += [f"{i} {i + 1} {rng.randint(1, 1000)} {rng.randint(1, 8)}" for i in range(1, n)]
+        lines += [f"{rng.randint(1, n)} {rng.randint(1, n)} {rng.randint(1, 1000)} {rng.randint(1, 8)}"
+                  for _ in range(m - n + 1)]
+        lines.append(str(q))
+        for _ in range(q):
+            s = rng.choice(hubs)
+            lines.append(f"{s} {s if rng.random() < 0.01 else rng.randint(1, n)}")
+    return Workload("Stable Power Network.py", ["--queries"], ("\n".join(lines) + "\n").encode(),
+                    T * q, "queries")
+
+def elliptic(rng, scale):
+    """Many additions over large primes, including doublings and inverses."""
+    T = scaled(200_000, scale)
+    primes = [(1 << 127) - 1, 2 ** 255 - 19, 1_000_000_007, 998_244_353]
+    lines = [str(T)]
+    for _ in range(T):
+        p = rng.choice(primes)
+        a = rng.randrange(p)
+        x1, y1 = rng.randrange(p), rng.randrange(p)
+        r = rng.random()
+        if r < 0.2:
+            x2, y2 = x1, y1
+        elif r < 0.3:
+            x2, y2 = x1, (p - y1) % p
+        else:
+            x2, y2 = rng.randrange(p), rng.randrange(p)
+        b = (y1 * y1 - x1 ** 3 - a * x1) % p
+        lines.append(f"{a} {b} {p} {x1} {y1} {x2} {y2}")
+    return Workload("Secure elliptic point addition.py", [], ("\n".join(lines) + "\n").encode(), T, "cases")
+
+# (a, b, p, x, y) of secp256k1 (a = 0) and P-256 (a = -3)
+STANDARD_CURVES = [
+    (0, 7, 2 ** 256 - 2 ** 32 - 977,
+     0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+     0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8),
+    (-3, 0x5AC635D8AA3A93E7B3EBBD55769886BC651D06B0CC53B0F63BCE3C3E27D2604B,
+     2 ** 256 - 2 ** 224 + 2 ** 192 + 2 ** 96 - 1,
+     0x6B17D1F2E12C4247F8BCE6E563A440F277037D812DEB33A0F4A13945D898C296,
+     0x4FE342E2FE1A7F9B8EE7EB4A7C0F9E162BCE33576B315ECECBB6406837BF51F5),
+]
+
+def elliptic_multiply(rng, scale):
+    """
+    Scalar multiplications (--multiply): mostly by the generators of a
+    few hot curves (fixed-base tables), the rest on one-off curves.
+    """
+    T = scaled(5_000, scale)
+    p = (1 << 127) - 1
+    x, y, a = rng.randrange(p), rng.randrange(p), rng.randrange(p)
+    hot = STANDARD_CURVES + [(a, (y * y - x ** 3 - a * x) % p, p, x, y)]
+    lines = [str(T)]
+    for _ in range(T):
+        if rng.random() < 0.8:
+            a, b, p, x, y = rng.choice(hot)
+        else:
+            p = rng.choice([2 ** 255 - 19, 1_000_000_007])
+            x, y, a = rng.randrange(p), rng.randrange(p), rng.randrange(p)
+            b = (y * y - x ** 3 - a * x) % p
+        k = rng.choice([rng.getrandbits(256), rng.randrange(-p, p), rng.randint(0, 3)])
+        lines.append(f"{a} {b} {p} {k} {x} {y}")
+    return Workload("Secure elliptic point addition.py", ["--multiply"], ("\n".join(lines) + "\n").encode(),
+                    T, "cases")
+
+def triplet(rng, scale):
+    """A large batch of N up to 10^18, odd, even and powers of two mixed."""
+    T = scaled(2_000_000, scale)
+    values = []
+    for _ in range(T):
+        r = rng.random()
+        if r < 0.05:
+            values.append(1 << rng.randrange(1, 60))
+        elif r < 0.25:
+            values.append(rng.randrange(1, 10 ** 18) | 1)
+        else:
+            values.append(rng.randrange(1, 10 ** 18) & ~1)
+    return Workload("Shailesh's Triplet.py", [], (f"{T}\n" + "\n".join(map(str, values)) + "\n").encode(), T, "cases")
+
+# Benchmark name -> generator, in report order
+GENERATORS = {
+    "airline": airline,
+    "airline-large-k": airline_large_k,
+    "airline-budgets": airline_budgets,
+    "expectation": expectation,
+    "expectation-moments": expectation_moments,
+    "magic-wands": magic_wands,
+    "magic-wands-all-k": magic_wands_all_k,
+    "palindrome": palindrome,
+    "palindrome-sparse": palindrome_sparse,
+    "stable-power": stable_power,
+    "stable-power-queries": stable_power_queries,
+    "elliptic": elliptic,
+    "elliptic-multiply": elliptic_multiply,
+    "triplet": triplet,
+}
+
+def generate(name, seed, scale):
+    """Builds the named workload; the same seed and scale give the same bytes."""
+    rng = random.Random(f"{name}:{seed}")
+    return GENERATORS[name](rng, scale)
@@ -0,0 +1,36 @@
+"""
+Minimal process launcher for the benchmark harness.
+
+The peak RSS that wait4 reports for a child includes the pages its parent
+had when it forked, so solvers are started from this small process rather
+than from the harness holding large generated inputs. Protocol: one JSON
+request per stdin line ({"argv", "cwd", "stdin", "stdout", "stderr"}, the
+last three being file paths, plus an optional "env" of extra environment
+variables), one JSON reply per stdout line ({"seconds", "returncode",
+"maxrss_kib"}).
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+def main():
+    for line in sys.stdin:
+        request = json.loads(line)
+        env = {**os.environ, **request["env"]} if request.get("env") else None
+        with open(request["stdin"], "rb") as stdin, open(request["stdout"], "wb") as stdout, \
+                open(request["stderr"], "wb") as stderr:
+            start = time.perf_counter()
+            process = subprocess.Popen(request["argv"], cwd=request["cwd"], env=env,
+                                       stdin=stdin, stdout=stdout, stderr=stderr)
+            _, status, usage = os.wait4(process.pid, 0)
+            elapsed = time.perf_counter() - start
+        # ru_maxrss is in KiB on Linux and in bytes on macOS
+        maxrss = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+        reply = {"seconds": elapsed, "returncode": os.waitstatus_to_exitcode(status), "maxrss_kib": maxrss}
+        sys.stdout.write(json.dumps(reply) + "\n")
+        sys.stdout.flush()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+Runs the benchmark workloads and compares them with a JSON baseline.
+
+    python -m bench.run                  # run everything, compare with baseline.json
+    python -m bench.run --only triplet   # a subset (repeatable flag)
+    python -m bench.run --update --repeat 3   # rewrite the baseline (best of 3)
+    python -m bench.run --scale 0.1      # smaller inputs (baseline must match)
+    python -m bench.run --profile        # also break each solve into phases
+
+Each workload is measured in phases:
+  generate  building the seeded input
+  parse     tokenizing the input with xtreme19.fastio (tracemalloc peak)
+  solve     the solver script in a subprocess (wall time, peak RSS)
+Solve time, peak RSS and the output digest are checked against the
+baseline; any regression beyond the tolerance exits with status 1.
+With --profile every solver gets one extra, untimed run under
+XTREME19_PROFILE=1, and its phase timings and counters (see
+xtreme19.profiling) are printed and stored with the results.
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from bench.generators import GENERATORS, generate
+from xtreme19.fastio import TokenReader
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(REPO_ROOT, "bench", "baseline.json")
+
+def measure_in_process(function, *args):
+    """
+    Runs function(*args) untraced for the time, then again under
+    tracemalloc for the peak; returns (result, seconds, peak MiB).
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / (1 << 20)
+
+def count_tokens(data):
+    return TokenReader(data).skip(len(data))
+
+class SolverRunner:
+    """
+    Runs solver scripts with a file as stdin, through bench.launcher
+    where os.wait4 exists (for an accurate per-solver peak RSS), or
+    directly without a memory figure elsewhere. Start it before building
+    any large input.
+    """
+    def __init__(self):
+        self.launcher = None
+        if hasattr(os, "wait4"):
+            self.launcher = subprocess.Popen(
+                [sys.executable, os.path.join(REPO_ROOT, "bench", "launcher.py")],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+
+    def close(self):
+        if self.launcher is not None:
+            self.launcher.stdin.close()
+            self.launcher.wait()
+
+    def run(self, script, args, input_path, env=None):
+        """
+        Returns (seconds, peak RSS in MiB or None, stdout bytes, stderr
+        bytes); env holds extra environment variables for the solver.
+        """
+        argv = [sys.executable, os.path.join(REPO_ROOT, script), *args]
+        with tempfile.TemporaryDirectory() as scratch:
+            stdout_path = os.path.join(scratch, "stdout")
+            stderr_path = os.path.join(scratch, "stderr")
+            if self.launcher is not None:
+                request = {"argv": argv, "cwd": REPO_ROOT, "stdin": input_path,
+                           "stdout": stdout_path, "stderr": stderr_path, "env": env}
+                self.launcher.stdin.write(json.dumps(request) + "\n")
+                self.launcher.stdin.flush()
+                reply = json.loads(self.launcher.stdout.readline())
+                elapsed, returncode = reply["seconds"], reply["returncode"]
+                rss = reply["maxrss_kib"] / 1024
+            else:
+                with open(input_path, "rb") as stdin, open(stdout_path, "wb") as stdout, \
+                        open(stderr_path, "wb") as stderr:
+                    start = time.perf_counter()
+                    returncode = subprocess.call(argv, cwd=REPO_ROOT, stdin=stdin, stdout=stdout,
+                                                 stderr=stderr, env={**os.environ, **(env or {})})
+                    elapsed = time.perf_counter() - start
+                rss = None
+            if returncode != 0:
+                with open(stderr_path, "rb") as stderr:
+                    raise RuntimeError(f"{script} exited with {returncode}:\n"
+                                       + stderr.read().decode(errors="replace"))
+            with open(stdout_path, "rb") as stdout, open(stderr_path, "rb") as stderr:
+                return elapsed, rss, stdout.read(), stderr.read()
+
+def read_profile(stderr):
+    """The last profiling report in a solver's stderr, or None."""
+    for line in reversed(stderr.splitlines()):
+        if line.startswith(b'{"profile"'):
+            report = json.loads(line)
+            return {"phases": report["phases"], "counters": report["counters"]}
+    return None
+
+def run_workload(runner, name, seed, scale, repeat, profile=False):
+    """Measures every phase of one workload; returns its result record."""
+    start = time.perf_counter()
+    workload = generate(name, seed, scale)
+    gen_time = time.perf_counter() - start
+    size_mib = len(workload.data) / (1 << 20)
+    tokens, parse_time, parse_peak = measure_in_process(count_tokens, workload.data)
+
+    with tempfile.NamedTemporaryFile(suffix=".in", delete=False) as input_file:
+        input_file.write(workload.data)
+    try:
+        runs = [runner.run(workload.script, workload.args, input_file.name) for _ in range(repeat)]
+        if profile:
+            stderr = runner.run(workload.script, workload.args, input_file.name,
+                                env={"XTREME19_PROFILE": "1"})[3]
+    finally:
+        os.unlink(input_file.name)
+    # Best of the repeats, to keep scheduling noise out of the baseline
+    solve_time = min(run[0] for run in runs)
+    rss_values = [run[1] for run in runs if run[1] is not None]
+    rss = min(rss_values) if rss_values else None
+    output = runs[0][2]
+
+    result = {
+        "script": workload.script,
+        "args": workload.args,
+        "input_mib": round(size_mib, 2),
+        "output_sha256": hashlib.sha256(output).hexdigest(),
+        "phases": {
+            "generate": {"seconds": round(gen_time, 3), "mib_per_s": round(size_mib / gen_time, 1)},
+            "parse": {"seconds": round(parse_time, 3), "peak_mib": round(parse_peak, 1),
+                      "tokens": tokens, "tokens_per_s": round(tokens / parse_time)},
+            "solve": {"seconds": round(solve_time, 3),
+                      "rss_mib": None if rss is None else round(rss, 1),
+                      workload.unit + "_per_s": round(workload.units / solve_time),
+                      "mib_per_s": round(size_mib / solve_time, 1)},
+        },
+    }
+    if profile:
+        result["profile"] = read_profile(stderr)
+    return result
+
+def print_result(name, result):
+    phases = result["phases"]
+    generate_phase, parse, solve = phases["generate"], phases["parse"], phases["solve"]
+    rate = next(f"{value:,} {key[:-6]}/s" for key, value in solve.items()
+                if key.endswith("_per_s") and key != "mib_per_s")
+    rss = "n/a" if solve["rss_mib"] is None else f"{solve['rss_mib']:.0f} MiB"
+    print(f"{name:<20} {result['input_mib']:>7.1f} MiB in | "
+          f"generate {generate_phase['seconds']:6.2f}s | "
+          f"parse {parse['seconds']:5.2f}s {parse['peak_mib']:6.1f} MiB {parse['tokens_per_s']:>11,} tok/s | "
+          f"solve {solve['seconds']:6.2f}s {rss:>8} {rate}")
+    if result.get("profile"):
+        for phase in result["profile"]["phases"]:
+            print(f"    {phase['name']:<28} {phase['seconds']:8.3f}s x{phase['calls']}")
+        for counter, value in result["profile"]["counters"].items():
+            print(f"    {counter:<28} {value:>14,}")
+
+def compare(name, result, expected, tolerance, slack):
+    """
+    Returns the list of regressions of result against its baseline entry.
+    Times may exceed the baseline by tolerance (relative) plus slack
+    seconds, so short workloads do not trip on scheduling noise.
+    """
+    problems = []
+    if result["output_sha256"] != expected["output_sha256"]:
+        problems.append("output changed (sha256 mismatch)")
+    solve, baseline_solve = result["phases"]["solve"], expected["phases"]["solve"]
+    limit = baseline_solve["seconds"] * (1 + tolerance) + slack
+    if solve["seconds"] > limit:
+        problems.append(f"solve time {solve['seconds']:.2f}s > {limit:.2f}s "
+                        f"(baseline {baseline_solve['seconds']:.2f}s)")
+    if solve["rss_mib"] is not None and baseline_solve["rss_mib"] is not None:
+        limit = baseline_solve["rss_mib"] * (1 + tolerance)
+        if solve["rss_mib"] > limit:
+            problems.append(f"peak RSS {solve['rss_mib']:.0f} MiB > {limit:.0f} MiB "
+                            f"(baseline {baseline_solve['rss_mib']:.0f} MiB)")
+    return [f"{name}: {problem}" for problem in problems]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the solver scripts.")
+    parser.add_argument("--only", action="append", choices=list(GENERATORS),
+                        help="run only this workload (repeatable)")
+    parser.add_argument("--seed", type=int, default=19)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=1, help="solver runs per workload (best is kept)")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown / memory growth over the baseline (0.25 = 25%%)")
+    parser.add_argument("--slack", type=float, default=0.5,
+                        help="extra seconds allowed on top of the relative tolerance")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--json", help="also write this run's results to the given file")
+    parser.add_argument("--profile", action="store_true",
+                        help="add one profiled run per solver and report its phases")
+    options = parser.parse_args()
+
+    names = options.only or list(GENERATORS)
+    results = {}
+    runner = SolverRunner()
+    try:
+        for name in names:
+            results[name] = run_workload(runner, name, options.seed, options.scale, options.repeat,
+                                         options.profile)
+            print_result(name, results[name])
+    finally:
+        runner.close()
+
+    run = {
+        "seed": options.seed,
+        "scale": options.scale,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "workloads": results,
+    }
+    if options.json:
+        with open(options.json, "w") as file:
+            json.dump(run, file, indent=2)
+
+    if options.update:
+        if os.path.exists(options.baseline) and options.only:
+            # Keep the workloads that were not rerun
+            with open(options.baseline) as file:
+                stored = json.load(file)
+            if (stored["seed"], stored["scale"]) == (options.seed, options.scale):
+                run["workloads"] = {**stored["workloads"], **results}
+        with open(options.baseline, "w") as file:
+            json.dump(run, file, indent=2)
+            file.write("\n")
+        print(f"baseline written to {options.baseline}")
+        return 0
+
+    if not os.path.exists(options.baseline):
+        print("no baseline yet; run with --update to create one")
+        return 0
+    with open(options.baseline) as file:
+        baseline = json.load(file)
+    if (baseline["seed"], baseline["scale"]) != (options.seed, options.scale):
+        print(f"baseline was recorded with seed {baseline['seed']} and scale {baseline['scale']}; "
+              f"rerun with those or --update", file=sys.stderr)
+        return 2
+
+    regressions = []
+    for name, result in results.items():
+        if name in baseline["workloads"]:
+            regressions += compare(name, result, baseline["workloads"][name],
+                                   options.tolerance, options.slack)
+        else:
+            print(f"{name}: not in the baseline")
+    if regressions:
+        print("\nREGRESSIONS:", file=sys.stderr)
+        for line in regressions:
+            print("  " + line, file=sys.stderr)
+        return 1
+    print("\nno regressions against the baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
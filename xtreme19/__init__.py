@@ -0,0 +1,3 @@
+"""
+Shared building blocks for the IEEEXtreme 19.0 solver scripts.
+"""
@@ -0,0 +1,108 @@
+"""
+Batch runner: answers a directory of input files with one solver, in
+parallel over a process pool, writing the outputs in input order.
+
+    python -m xtreme19.batch stable-power inputs/ --output-dir outputs/
+    python -m xtreme19.batch airline inputs/ --pattern '*.txt' -- --residues
+
+Each worker imports the solver once and then handles many files, so the
+interpreter start-up and import cost is paid per worker, not per file.
+Without --output-dir the outputs are concatenated to stdout.
+"""
+import argparse
+import fnmatch
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from xtreme19 import solvers
+
+def _init_worker(name):
+    solvers.load(name)
+
+def _solve_file(job):
+    """Worker side: returns (output bytes or None, error text or None, seconds)."""
+    name, path, argv = job
+    start = time.perf_counter()
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+        return solvers.solve(name, data, argv), None, time.perf_counter() - start
+    except Exception:
+        return None, traceback.format_exc(), time.perf_counter() - start
+
+def list_inputs(directory, pattern):
+    """Input files of directory matching pattern, in sorted order."""
+    return [os.path.join(directory, entry) for entry in sorted(os.listdir(directory))
+            if fnmatch.fnmatch(entry, pattern) and os.path.isfile(os.path.join(directory, entry))]
+
+def output_path(output_dir, input_path, suffix):
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    return os.path.join(output_dir, stem + suffix)
+
+def run_batch(name, paths, argv=(), workers=None, chunksize=None):
+    """
+    Solves every file in paths with the named solver and yields
+    (path, output, error, seconds) in the order of paths.
+    """
+    jobs = [(name, path, list(argv)) for path in paths]
+    if workers == 1:
+        solvers.load(name)
+        results = map(_solve_file, jobs)
+        for path, result in zip(paths, results):
+            yield (path, *result)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        # A few chunks per worker keeps the pool busy without much IPC
+        chunksize = max(1, len(jobs) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(name,)) as pool:
+        for path, result in zip(paths, pool.map(_solve_file, jobs, chunksize=chunksize)):
+            yield (path, *result)
+
+def main():
+    parser = argparse.ArgumentParser(description="Run one solver over a directory of inputs.",
+                                     usage="%(prog)s solver input_dir [options] [-- solver flags]")
+    parser.add_argument("solver", choices=list(solvers.SOLVER_FILES))
+    parser.add_argument("input_dir")
+    parser.add_argument("--pattern", default="*", help="input file name pattern (default: all files)")
+    parser.add_argument("--output-dir", help="write one output file per input here instead of stdout")
+    parser.add_argument("--suffix", default=".out", help="output file suffix (default: .out)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, help="files handed to a worker at a time")
+    # Everything after "--" is passed to the solver untouched
+    argv = sys.argv[1:]
+    solver_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, solver_args = argv[:split], argv[split + 1:]
+    options = parser.parse_args(argv)
+
+    paths = list_inputs(options.input_dir, options.pattern)
+    if options.output_dir:
+        os.makedirs(options.output_dir, exist_ok=True)
+
+    failures = 0
+    start = time.perf_counter()
+    stdout = sys.stdout.buffer
+    for path, output, error, seconds in run_batch(options.solver, paths, solver_args,
+                                                  options.workers, options.chunksize):
+        if error is not None:
+            failures += 1
+            print(f"{path}: failed\n{error}", file=sys.stderr)
+            continue
+        if options.output_dir:
+            with open(output_path(options.output_dir, path, options.suffix), "wb") as file:
+                file.write(output)
+        else:
+            stdout.write(output)
+    stdout.flush()
+    print(f"{len(paths)} inputs, {failures} failed, {time.perf_counter() - start:.2f}s",
+          file=sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+from array import array
+
+from xtreme19 import profiling
+
+class DisjointSetUnion:
+    """
+    DSU over the integers 0..n-1 backed by flat integer arrays.
+    Uses iterative path halving and union-by-size, so no recursion
+    limit or helper thread is needed for long parent chains.
+    """
+    def __init__(self, n):
+        self.parents = array('i', range(n))
+        self.sizes = array('i', [1]) * n
+
+    def get_root(self, i):
+        """Find the root of i, halving the path on the way up."""
+        parents = self.parents
+        while parents[i] != i:
+            grandparent = parents[parents[i]]
+            parents[i] = grandparent
+            i = grandparent
+        return i
+
+    def merge_sets(self, i, j):
+        """Merge the sets containing i and j. Return True if merged."""
+        root_i = self.get_root(i)
+        root_j = self.get_root(j)
+
+        if root_i != root_j:
+            # Union by size
+            if self.sizes[root_i] < self.sizes[root_j]:
+                root_i, root_j = root_j, root_i
+            self.parents[root_j] = root_i
+            self.sizes[root_i] += self.sizes[root_j]
+            return True
+        return False
+
+    def union_many(self, pairs):
+        """
+        Merges every (i, j) in pairs and returns how many merges happened.
+        pairs may be any iterable of pairs or a (k, 2) NumPy index array.
+        """
+        if hasattr(pairs, 'tolist'):
+            # NumPy rows become plain int lists in C-level calls, a
+            # chunk at a time so huge arrays are never fully boxed
+            chunk_size = 1 << 16
+            return sum(
+                self.union_many(pairs[start:start + chunk_size].tolist())
+                for start in range(0, len(pairs), chunk_size)
+            )
+
+        parents = self.parents
+        sizes = self.sizes
+        merged = 0
+        for i, j in pairs:
+            # Inlined get_root for both ends
+            while parents[i] != i:
+                grandparent = parents[parents[i]]
+                parents[i] = grandparent
+                i = grandparent
+            while parents[j] != j:
+                grandparent = parents[parents[j]]
+                parents[j] = grandparent
+                j = grandparent
+            if i == j:
+                continue
+            if sizes[i] < sizes[j]:
+                i, j = j, i
+            parents[j] = i
+            sizes[i] += sizes[j]
+            merged += 1
+        return merged
+
+if profiling.ENABLED:
+    # Counting variants, swapped in only while profiling
+    _get_root = DisjointSetUnion.get_root
+    _union_many = DisjointSetUnion.union_many
+
+    def _counted_get_root(self, i):
+        profiling.count("dsu_finds")
+        return _get_root(self, i)
+
+    def _counted_union_many(self, pairs):
+        if hasattr(pairs, 'tolist'):
+            # Comes back here one list chunk at a time
+            return _union_many(self, pairs)
+        if not hasattr(pairs, '__len__'):
+            pairs = list(pairs)
+        profiling.count("dsu_finds", 2 * len(pairs))
+        merged = _union_many(self, pairs)
+        profiling.count("dsu_merges", merged)
+        return merged
+
+    DisjointSetUnion.get_root = _counted_get_root
+    DisjointSetUnion.union_many = _counted_union_many
@@ -0,0 +1,189 @@
+"""
+Fast input/output shared by the solver scripts.
+
+TokenReader walks a cursor over the whole of stdin, read once (or mmapped
+when stdin is a regular file). Writer batches output into large chunks,
+so it stays cheap even when stdout itself is unbuffered.
+"""
+import mmap
+import os
+import re
+import stat
+import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TOKEN_PATTERN = re.compile(rb'\S+')
+
+# Tokens split per step by the bulk readers, bounding their scratch lists
+BULK_TOKENS = 1 << 16
+
+def read_stdin():
+    """
+    Returns all of stdin as one buffer, plus the offset already consumed.
+    A regular file is mmapped instead of copied; anything else (pipes,
+    terminals, empty files) is read in one go.
+    """
+    try:
+        fd = sys.stdin.fileno()
+        info = os.fstat(fd)
+        if stat.S_ISREG(info.st_mode) and info.st_size > 0:
+            offset = os.lseek(fd, 0, os.SEEK_CUR)
+            return mmap.mmap(fd, 0, access=mmap.ACCESS_READ), offset
+    except (AttributeError, OSError, ValueError):
+        pass
+    return sys.stdin.buffer.read(), 0
+
+class TokenReader:
+    """
+    Cursor over an input buffer (stdin by default). Single tokens come
+    from a regex search at the cursor; bulk reads split a window ahead of
+    the cursor in one C call and move the cursor past exactly the tokens
+    they used, so token, bulk and line reads can be mixed freely.
+    """
+    def __init__(self, data=None):
+        if data is None:
+            data, pos = read_stdin()
+        else:
+            pos = 0
+        self.data = data
+        self.pos = pos
+        self.length = len(data)
+
+    def token(self):
+        """The next whitespace-separated token, or b'' at end of input."""
+        match = TOKEN_PATTERN.search(self.data, self.pos)
+        if match is None:
+            self.pos = self.length
+            return b''
+        self.pos = match.end()
+        return match.group()
+
+    def int(self):
+        """The next token as an int (ValueError at end of input)."""
+        return int(self.token())
+
+    def readline(self):
+        """The rest of the current line including its newline, like file.readline()."""
+        end = self.data.find(b'\n', self.pos)
+        end = self.length if end < 0 else end + 1
+        line = self.data[self.pos:end]
+        self.pos = end
+        return line
+
+    def tokens(self, n):
+        """The next n tokens (fewer at end of input) as a list of bytes."""
+        if n <= 0:
+            return []
+        data, pos = self.data, self.pos
+        # Size the window from the token density of a small sample
+        sample = data[pos:pos + 4096].split()
+        width = 4096 // len(sample) + 1 if len(sample) > 1 else 16
+        window = width * n + 64
+        while True:
+            end = min(pos + window, self.length)
+            chunk = data[pos:end]
+            parts = chunk.split(None, n)
+            if len(parts) > n:
+                # parts[n] is everything after the n-th token, with the
+                # whitespace in front of it already stripped
+                self.pos = end - len(parts[n])
+                del parts[n]
+                return parts
+            if end == self.length:
+                self.pos = end
+                return parts
+            # Too few tokens (or the last one cut short): widen the window
+            # by the density seen so far
+            window = max(2 * window, window * (n + 1) // max(len(parts) - 1, 1) + 64)
+
+    def skip(self, n):
+        """Moves the cursor past the next n tokens; returns how many it passed."""
+        passed = 0
+        while passed < n:
+            step = len(self.tokens(min(n - passed, BULK_TOKENS)))
+            if step == 0:
+                break
+            passed += step
+        return passed
+
+    def ints(self, n=None):
+        """
+        The next n integers (fewer at end of input, all that remain if
+        n is None) as array('q').
+        """
+        if np is not None:
+            values = array('q')
+            values.frombytes(self.ints_array(n).tobytes())
+            return values
+        values = array('q')
+        while n is None or len(values) < n:
+            block = self.tokens(BULK_TOKENS if n is None else min(n - len(values), BULK_TOKENS))
+            if not block:
+                break
+            values.extend(map(int, block))
+        return values
+
+    def ints_array(self, n=None, dtype=None):
+        """
+        The next n integers (all that remain if n is None) as a NumPy
+        array. Raises ValueError on tokens NumPy cannot parse; values
+        outside the dtype's range saturate silently.
+        """
+        if dtype is None:
+            dtype = np.int64
+        start = self.pos
+        if n is None:
+            self.pos = self.length
+        else:
+            self.skip(n)
+        text = self.data[start:self.pos]
+        if TOKEN_PATTERN.search(text) is None:
+            return np.zeros(0, dtype=dtype)
+        return np.fromstring(text, dtype=dtype, sep=' ')
+
+class Writer:
+    """
+    Chunked output buffer over stdout's file descriptor, or over any
+    binary file-like sink (e.g. io.BytesIO). Accepts str or bytes; data
+    is written once CHUNK_SIZE bytes have gathered and on flush(), which
+    callers must invoke before exiting.
+    """
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, sink=None, chunk_size=CHUNK_SIZE):
+        if sink is None:
+            # Anything already written through sys.stdout goes out first
+            sys.stdout.flush()
+            sink = open(sys.stdout.fileno(), 'wb', buffering=0, closefd=False)
+        self.sink = sink
+        self.chunk_size = chunk_size
+        self.parts = []
+        self.size = 0
+
+    def write(self, data):
+        if isinstance(data, str):
+            data = data.encode()
+        self.parts.append(data)
+        self.size += len(data)
+        if self.size >= self.chunk_size:
+            self.flush()
+
+    def write_lines(self, lines):
+        """Writes each line (all str or all bytes) followed by a newline."""
+        if lines:
+            newline = '\n' if isinstance(lines[0], str) else b'\n'
+            self.write(newline.join(lines) + newline)
+
+    def flush(self):
+        if self.parts:
+            block = memoryview(b''.join(self.parts))
+            self.parts = []
+            self.size = 0
+            # A raw file may accept only part of a large write
+            while block:
+                block = block[self.sink.write(block):]
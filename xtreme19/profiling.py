@@ -0,0 +1,171 @@
+"""
+Opt-in per-phase profiling for the solver scripts.
+
+Set XTREME19_PROFILE=1 to time named phases with perf_counter and tally
+event counters (heap pushes, DSU finds, knapsack cell updates, ...); a
+one-line JSON report is written to stderr when the process exits. Phases
+nest, so a phase entered inside "solve" is reported as "solve/<name>".
+lap(name) closes a phase that started at the previous lap (or at the
+start of the enclosing phase), which suits the numbered steps of a
+solver without re-indenting them. Worker processes do not report on
+their own: they hand their share to the parent with take(), which the
+parent adds under its current phase with merge(), so worker phase times
+are summed over all workers.
+
+When the variable is unset, ENABLED is False, phase() hands back one
+shared no-op context manager, count(), lap() and merge() do nothing,
+take() returns None and timed() returns the function untouched. Solvers
+only call these at phase boundaries and compute counts from sizes they
+already know, so a disabled run executes the same inner loops as before.
+"""
+import atexit
+import json
+import os
+import sys
+import time
+
+ENABLED = os.environ.get("XTREME19_PROFILE", "") not in ("", "0")
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_PHASE = _NullPhase()
+
+class Profiler:
+    """Accumulates phase timings and counters for one process."""
+    def __init__(self):
+        self.started = self.lap_started = time.perf_counter()
+        self.stack = []
+        # Phase path -> [seconds, calls], in order of first entry
+        self.phases = {}
+        self.counters = {}
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def lap(self, name):
+        """Records the time since the previous lap as phase name."""
+        now = time.perf_counter()
+        self.record("/".join(self.stack + [name]), now - self.lap_started)
+        self.lap_started = now
+
+    def record(self, path, elapsed, calls=1):
+        entry = self.phases.get(path)
+        if entry is None:
+            self.phases[path] = [elapsed, calls]
+        else:
+            entry[0] += elapsed
+            entry[1] += calls
+
+    def take(self):
+        """
+        Returns the phases and counters so far and starts over empty.
+        Phase paths are made relative to the current phase, which a
+        forked worker inherits from its parent.
+        """
+        prefix = "".join(name + "/" for name in self.stack)
+        phases = {path[len(prefix):] if path.startswith(prefix) else path: entry
+                  for path, entry in self.phases.items()}
+        taken = {"phases": phases, "counters": self.counters}
+        self.phases = {}
+        self.counters = {}
+        return taken
+
+    def merge(self, taken):
+        """Adds the result of another process's take() under the current phase."""
+        prefix = "".join(name + "/" for name in self.stack)
+        for name, (seconds, calls) in taken["phases"].items():
+            self.record(prefix + name, seconds, calls)
+        for name, amount in taken["counters"].items():
+            self.count(name, amount)
+
+    def report(self):
+        """The collected profile as a JSON-serialisable dict."""
+        return {
+            "profile": os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else "python",
+            "wall_seconds": round(time.perf_counter() - self.started, 6),
+            "phases": [{"name": name, "seconds": round(seconds, 6), "calls": calls}
+                       for name, (seconds, calls) in self.phases.items()],
+            "counters": dict(self.counters),
+        }
+
+    def emit(self, stream=None):
+        stream = stream or sys.stderr
+        stream.write(json.dumps(self.report()) + "\n")
+        stream.flush()
+
+class _Phase:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        stack = self.profiler.stack
+        stack.append(self.name)
+        self.name = "/".join(stack)
+        self.start = self.profiler.lap_started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        profiler = self.profiler
+        profiler.lap_started = now = time.perf_counter()
+        profiler.stack.pop()
+        profiler.record(self.name, now - self.start)
+        return False
+
+if ENABLED:
+    profiler = Profiler()
+    phase = profiler.phase
+    count = profiler.count
+    lap = profiler.lap
+    take = profiler.take
+    merge = profiler.merge
+
+    def _emit_from_main():
+        import multiprocessing
+        if multiprocessing.parent_process() is None:
+            profiler.emit()
+
+    atexit.register(_emit_from_main)
+
+    def timed(name):
+        """Decorator: runs every call of the function as phase name."""
+        def wrap(function):
+            def timed_function(*args, **kwargs):
+                with phase(name):
+                    return function(*args, **kwargs)
+            timed_function.__name__ = function.__name__
+            timed_function.__doc__ = function.__doc__
+            return timed_function
+        return wrap
+else:
+    profiler = None
+
+    def phase(name):
+        return _NULL_PHASE
+
+    def count(name, amount=1):
+        pass
+
+    def lap(name):
+        pass
+
+    def take():
+        return None
+
+    def merge(taken):
+        pass
+
+    def timed(name):
+        return lambda function: function
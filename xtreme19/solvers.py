@@ -0,0 +1,55 @@
+"""
+Registry of the solver scripts, importable by name.
+
+The scripts live at the repository root under their problem titles, so
+they are loaded by path on first use (and cached); nothing is imported
+until a solver is asked for. Every script exposes
+run(reader, writer, argv), and solve() wraps it as a pure
+bytes-in, bytes-out call.
+"""
+import importlib.util
+import io
+import os
+import sys
+
+from xtreme19.fastio import TokenReader, Writer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Solver name -> script file name
+SOLVER_FILES = {
+    "airline": "Airline Travelling.py",
+    "expectation": "Do You Know Expectation.py",
+    "hack": "Hack The Coach.py",
+    "magic-wands": "Magic Wands.py",
+    "palindrome": "Palidrome Matrix.py",
+    "elliptic": "Secure elliptic point addition.py",
+    "triplet": "Shailesh's Triplet.py",
+    "stable-power": "Stable Power Network.py",
+}
+
+_loaded = {}
+
+def load(name):
+    """Imports (once) and returns the module of the named solver."""
+    module = _loaded.get(name)
+    if module is None:
+        if name not in SOLVER_FILES:
+            raise KeyError(f"unknown solver {name!r}; expected one of {', '.join(SOLVER_FILES)}")
+        path = os.path.join(REPO_ROOT, SOLVER_FILES[name])
+        module_name = "xtreme19_solver_" + name.replace("-", "_")
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        # Registered first so pickling can find classes defined in it
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        _loaded[name] = module
+    return module
+
+def solve(name, data, argv=()):
+    """Runs the named solver on the input bytes data; returns its output bytes."""
+    sink = io.BytesIO()
+    writer = Writer(sink)
+    load(name).run(TokenReader(data), writer, list(argv))
+    writer.flush()
+    return sink.getvalue()